@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import random
+import time
 from collections.abc import Awaitable
+from functools import partial
 from datetime import timedelta
 from typing import Any
 
@@ -37,10 +40,12 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     CONF_ADDRESS,
     EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
@@ -51,59 +56,82 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_time_interval,
 )
-from homeassistant.helpers.json import save_json
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import load_json
 
 from custom_components.bosch.switch import SWITCH
 
+from .bosch_entity import gateway_signal, object_signal
+from .cache import ResponseCache
 from .const import (
     ACCESS_KEY,
     ACCESS_TOKEN,
     BINARY_SENSOR,
     BOSCH_GATEWAY_ENTRY,
     CLIMATE,
+    CUSTOM,
+    CONF_CYCLE_REQUEST_BUDGET,
+    CONF_CUSTOM_GET_CACHE_TTL,
+    CONF_CUSTOM_PATHS,
+    CONF_CYCLE_TIME_BUDGET,
     CONF_DEVICE_TYPE,
+    CONF_MAX_SCAN_INTERVAL,
     CONF_PROTOCOL,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_SCAN_INTERVALS,
+    DEFAULT_CUSTOM_GET_CACHE_TTL,
+    DEFAULT_CYCLE_REQUEST_BUDGET,
+    DEFAULT_CYCLE_TIME_BUDGET,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_REFRESH_CONCURRENCY,
+    DEFAULT_SCAN_INTERVALS,
+    DIAGNOSTIC,
     DOMAIN,
     FIRMWARE_SCAN_INTERVAL,
     FW_INTERVAL,
     GATEWAY,
     INTERVAL,
+    LOWEST_PRIORITY,
+    MANUAL_REFRESH_COOLDOWN,
     NOTIFICATION_ID,
     RECORDING_INTERVAL,
-    SCAN_INTERVAL,
-    SIGNAL_BINARY_SENSOR_UPDATE_BOSCH,
     SIGNAL_BOSCH,
-    SIGNAL_CLIMATE_UPDATE_BOSCH,
-    SIGNAL_DHW_UPDATE_BOSCH,
-    SIGNAL_NUMBER,
-    SIGNAL_SELECT,
-    SIGNAL_SENSOR_UPDATE_BOSCH,
-    SIGNAL_SOLAR_UPDATE_BOSCH,
-    SIGNAL_SWITCH,
     SOLAR,
+    STATE_SAVE_DELAY,
+    STATE_STORAGE_VERSION,
+    TIER_PRIORITIES,
     UUID,
     WATER_HEATER,
+    WRITE_CONFIRM_DELAYS,
+    WRITE_DEBOUNCE_DELAY,
 )
+from .rate_limiter import GatewayRateLimiter
+from .rawscan import GatewayScanner, ScanWriter, load_scan, scan_diff
+from .refresh import (
+    PlannedRead,
+    RefreshPlan,
+    fan_out,
+    object_key,
+    read_failed,
+)
+from .request_queue import BACKGROUND, INTERACTIVE, POLL, PriorityRequestQueue
+from .scheduler import (
+    AdaptivePollScheduler,
+    CycleBudget,
+    FailureTracker,
+    gateway_time,
+    seconds_to_switchpoint,
+)
+from .sensor.custom import parse_custom_paths
 from .services import (
     async_register_debug_service,
     async_register_services,
     async_remove_services,
 )
-
-SIGNALS = {
-    CLIMATE: SIGNAL_CLIMATE_UPDATE_BOSCH,
-    WATER_HEATER: SIGNAL_DHW_UPDATE_BOSCH,
-    SENSOR: SIGNAL_SENSOR_UPDATE_BOSCH,
-    BINARY_SENSOR: SIGNAL_BINARY_SENSOR_UPDATE_BOSCH,
-    SOLAR: SIGNAL_SOLAR_UPDATE_BOSCH,
-    SWITCH: SIGNAL_SWITCH,
-    SELECT: SIGNAL_SELECT,
-    NUMBER: SIGNAL_NUMBER,
-}
+from .write_queue import DebouncedWriteQueue
 
 SUPPORTED_PLATFORMS = {
     HC: [CLIMATE],
@@ -117,6 +145,16 @@ SUPPORTED_PLATFORMS = {
     DV: [SENSOR],
 }
 
+REFRESH_PLATFORMS = (
+    SENSOR,
+    BINARY_SENSOR,
+    CLIMATE,
+    WATER_HEATER,
+    SWITCH,
+    NUMBER,
+    SELECT,
+)
+
 
 CUSTOM_DB = "custom_bosch_db.json"
 SERVICE_DEBUG_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_ids})
@@ -174,6 +212,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     remove_entry(INTERVAL)
     remove_entry(FW_INTERVAL)
     remove_entry(RECORDING_INTERVAL)
+    # Saving also cancels pending delayed save of states.
+    await data[BOSCH_GATEWAY_ENTRY].async_save_states()
     bosch = hass.data[DOMAIN].pop(uuid)
     unload_ok = await bosch[BOSCH_GATEWAY_ENTRY].async_reset()
     async_remove_services(hass, entry)
@@ -223,18 +263,136 @@ class BoschGatewayEntry:
         self._initial_update = False
         self._signal_registered = False
         self.supported_platforms = []
-        self._update_lock = None
+        self.request_queue = None
+        self._scan_task = None
+        self._refresh_debouncer = None
+        self._recording_debouncer = None
+        self._manual_targets = set()
+        self._manual_all = False
+        self._confirm_tasks = {}
+        self._confirm_waiters = {}
+        self.write_queue = DebouncedWriteQueue(WRITE_DEBOUNCE_DELAY)
+        self._notified_objects = set()
+        self._poll_schedulers = {}
+        self._pending_tiers = set()
+        self._pending_force = False
+        self._cycle_budget = None
+        self.rate_limiter = GatewayRateLimiter()
+        self.failures = FailureTracker()
+        self.response_cache = ResponseCache(
+            entry.options.get(CONF_CUSTOM_GET_CACHE_TTL, DEFAULT_CUSTOM_GET_CACHE_TTL)
+        )
+        self._state_store = Store(
+            hass, STATE_STORAGE_VERSION, f"{DOMAIN}.{uuid}.state"
+        )
+        self._restored_states = {}
+        self._save_states = True
 
     @property
     def device_id(self) -> str:
         return self.config_entry.entry_id
 
+    @property
+    def tier_intervals(self) -> dict[str, timedelta | None]:
+        """Polling interval of each tier, None if tier is refreshed manually."""
+        intervals = {}
+        for tier, default in DEFAULT_SCAN_INTERVALS.items():
+            seconds = self.config_entry.options.get(
+                CONF_SCAN_INTERVALS[tier], default.total_seconds()
+            )
+            intervals[tier] = timedelta(seconds=seconds) if seconds else None
+        custom_intervals = [
+            custom_path["interval"]
+            for custom_path in parse_custom_paths(
+                self.config_entry.options.get(CONF_CUSTOM_PATHS)
+            )
+            if custom_path["interval"]
+        ]
+        if custom_intervals:
+            intervals[CUSTOM] = timedelta(seconds=min(custom_intervals))
+        return intervals
+
+    @callback
+    def _async_track_tiers(self):
+        """Run separate timer for each distinct tier interval."""
+        tiers_by_interval = {}
+        for tier, interval in self.tier_intervals.items():
+            if interval:
+                tiers_by_interval.setdefault(interval, []).append(tier)
+            else:
+                _LOGGER.debug("Bosch %s entities are refreshed only manually.", tier)
+        unsubs = [
+            async_track_time_interval(
+                self.hass, partial(self.tier_refresh, tiers), interval
+            )
+            for interval, tiers in tiers_by_interval.items()
+        ]
+
+        @callback
+        def remove_tier_timers():
+            for unsub in unsubs:
+                unsub()
+
+        return remove_tier_timers
+
+    async def gateway_call(
+        self,
+        func,
+        *args,
+        cost: int = 1,
+        priority: int = INTERACTIVE,
+        failed=None,
+        **kwargs,
+    ):
+        """Run request to gateway in queue slot paced by rate limiter."""
+        async with self.request_queue.slot(priority):
+            return await self.rate_limiter.call(
+                func, *args, cost=cost, failed=failed, **kwargs
+            )
+
     async def async_init(self) -> bool:
         """Init async items in entry."""
         import bosch_thermostat_client as bosch
 
         _LOGGER.debug("Initializing Bosch integration.")
-        self._update_lock = asyncio.Lock()
+        self.request_queue = PriorityRequestQueue(
+            self.config_entry.options.get(
+                CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY
+            )
+        )
+        max_interval = timedelta(
+            seconds=self.config_entry.options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            )
+        )
+        self._poll_schedulers = {
+            tier: AdaptivePollScheduler(base_interval=interval, max_interval=max_interval)
+            for tier, interval in self.tier_intervals.items()
+            if interval and tier != CUSTOM
+        }
+        self._refresh_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=MANUAL_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._manual_refresh,
+        )
+        self._recording_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=MANUAL_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self.recording_sensors_update,
+        )
+        options = self.config_entry.options
+        self._cycle_budget = CycleBudget(
+            time_budget=timedelta(
+                seconds=options.get(CONF_CYCLE_TIME_BUDGET, DEFAULT_CYCLE_TIME_BUDGET)
+            ),
+            request_budget=options.get(
+                CONF_CYCLE_REQUEST_BUDGET, DEFAULT_CYCLE_REQUEST_BUDGET
+            ),
+        )
         BoschGateway = bosch.gateway_chooser(device_type=self._device_type)
         self.gateway = BoschGateway(
             session=async_get_clientsession(self.hass, verify_ssl=False)
@@ -251,10 +409,15 @@ class BoschGatewayEntry:
             _LOGGER.debug("Closing connection to Bosch")
             await self.gateway.close()
 
+        self._restored_states = await self._state_store.async_load() or {}
         if await self.async_init_bosch():
             self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_connection)
-            async_dispatcher_connect(
-                self.hass, SIGNAL_BOSCH, self.async_get_signals
+            self.config_entry.async_on_unload(
+                async_dispatcher_connect(
+                    self.hass,
+                    gateway_signal(SIGNAL_BOSCH, self.uuid),
+                    self.async_get_signals,
+                )
             )
             await self.hass.config_entries.async_forward_entry_setups(
                 self.config_entry,
@@ -287,15 +450,13 @@ class BoschGatewayEntry:
         ):
             _LOGGER.debug("Registering thermostat update interval.")
             self._signal_registered = True
-            self.hass.data[DOMAIN][self.uuid][INTERVAL] = async_track_time_interval(
-                self.hass, self.thermostat_refresh, SCAN_INTERVAL
-            )
+            self.hass.data[DOMAIN][self.uuid][INTERVAL] = self._async_track_tiers()
             self.hass.data[DOMAIN][self.uuid][FW_INTERVAL] = async_track_time_interval(
                 self.hass,
                 self.firmware_refresh,
                 FIRMWARE_SCAN_INTERVAL,  # SCAN INTERVAL FV
             )
-            async_call_later(self.hass, 5, self.thermostat_refresh)
+            async_call_later(self.hass, 5, partial(self.thermostat_refresh, force=True))
             asyncio.run_coroutine_threadsafe(self.recording_sensors_update(),
                 self.hass.loop
             )
@@ -356,23 +517,18 @@ class BoschGatewayEntry:
         if recording_callback is not None:
             recording_callback()
             recording_callback = None
-        updated = False
-        signals = []
         now = dt_util.now()
+        plan = RefreshPlan()
         for entity in entities:
             if entity.enabled:
-                try:
-                    _LOGGER.debug("Updating component 1-hour Sensor by %s", id(self))
-                    await entity.bosch_object.update(time=now)
-                    updated = True
-                    if entity.signal not in signals:
-                        signals.append(entity.signal)
-                except DeviceException as err:
-                    _LOGGER.warning(
-                        "Bosch object of entity %s is no longer available. %s",
-                        entity.name,
-                        err,
-                    )
+                plan.add(RECORDING, entity)
+        _LOGGER.debug("Updating component 1-hour Sensor by %s", id(self))
+        signals = []
+        for planned in await self._execute_plan(plan, time=now):
+            for _, entity in planned.all_dependents:
+                if entity.signal not in signals:
+                    signals.append(entity.signal)
+        updated = bool(signals)
 
         def rounder(t):
             matching_seconds = [0]
@@ -392,104 +548,507 @@ class BoschGatewayEntry:
         if updated:
             _LOGGER.debug("Bosch 1-hour entitites updated.")
             for signal in signals:
-                async_dispatcher_send(self.hass, signal)
+                async_dispatcher_send(self.hass, gateway_signal(signal, self.uuid))
             return True
 
     async def custom_put(self, path: str, value: Any) -> None:
         """Send PUT directly to gateway without parsing."""
-        await self.gateway.raw_put(path=path, value=value)
-
-    async def custom_get(self, path) -> str:
-        """Fetch value from gateway."""
-        async with self._update_lock:
-            return await self.gateway.raw_query(path=path)
-
-    async def component_update(self, component_type=None, event_time=None):
-        """Update data from HC, DHW, ZN, Sensors, Switch."""
-        if component_type in self.supported_platforms:
-            updated = False
-            entities = self.hass.data[DOMAIN][self.uuid][component_type]
-            for entity in entities:
-                if entity.enabled:
-                    try:
-                        _LOGGER.debug(
-                            "Updating component %s %s by %s",
-                            component_type,
-                            entity.entity_id,
-                            id(self),
-                        )
-                        await entity.bosch_object.update()
-                        updated = True
-                    except DeviceException as err:
-                        _LOGGER.warning(
-                            "Bosch object of entity %s is no longer available. %s",
-                            entity.name,
-                            err,
-                        )
-            if updated:
-                _LOGGER.debug(f"Bosch {component_type   } entitites updated.")
-                async_dispatcher_send(self.hass, SIGNALS[component_type])
-                return True
-        return False
+        self.response_cache.invalidate(path)
+        return await self.gateway_call(self.gateway.raw_put, path=path, value=value)
+
+    async def custom_get(self, path, bypass_cache: bool = False) -> str:
+        """Fetch value from gateway or from recent response of the same path."""
+        if not bypass_cache:
+            cached = self.response_cache.get(path)
+            if cached is not None:
+                _LOGGER.debug("Returning cached response of %s.", path)
+                return cached
+        response = await self.gateway_call(
+            self.gateway.raw_query, path=path, failed=lambda result: result is None
+        )
+        self.response_cache.set(path, response)
+        return response
+
+    async def custom_get_batch(
+        self, paths: list[str], bypass_cache: bool = False
+    ) -> dict[str, Any]:
+        """Fetch many values concurrently within gateway queue."""
+        results = await asyncio.gather(
+            *[self.custom_get(path, bypass_cache) for path in paths]
+        )
+        return dict(zip(paths, results))
+
+    async def custom_put_batch(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Send many PUTs in given order."""
+        return {
+            path: await self.custom_put(path=path, value=value)
+            for path, value in values.items()
+        }
+
+    async def _update_planned(
+        self,
+        planned: PlannedRead,
+        deadline: float | None = None,
+        priority: int = POLL,
+        **kwargs,
+    ) -> bool:
+        """Read single Bosch object in queue slot."""
+        async with self.request_queue.slot(priority):
+            if deadline and time.monotonic() > deadline:
+                _LOGGER.debug("Cycle time budget spent, postponing %s.", planned.key)
+                return False
+            try:
+                _LOGGER.debug("Updating Bosch object %s by %s", planned.key, id(self))
+                await self.rate_limiter.call(
+                    planned.bosch_object.update,
+                    cost=planned.cost,
+                    failed=lambda _: read_failed(planned.bosch_object),
+                    **kwargs,
+                )
+            except DeviceException as err:
+                self.failures.record_failure(planned.key, err, planned.names)
+                return False
+        if read_failed(planned.bosch_object):
+            self.failures.record_failure(
+                planned.key, planned.bosch_object.state_message, planned.names
+            )
+        else:
+            self.failures.record_success(planned.key, planned.names)
+        self._cycle_budget.mark_read(planned.key)
+        for served in planned.served:
+            fan_out(planned.bosch_object, served.bosch_object)
+        planned.compare()
+        return True
+
+    async def _execute_plan(
+        self, plan: RefreshPlan, budgeted: bool = False, priority: int = POLL, **kwargs
+    ) -> list:
+        """Issue each planned read once, return reads which succeeded.
+
+        Budgeted plan reads most important objects first and postpones
+        ones which don't fit cycle budget.
+        """
+        reads = plan.resolve()
+        deadline = None
+        if budgeted:
+            reads, postponed = self._cycle_budget.select(reads)
+            deadline = self._cycle_budget.deadline()
+            if postponed:
+                _LOGGER.debug(
+                    "Cycle request budget spent, postponing %d reads.", len(postponed)
+                )
+        _LOGGER.debug(
+            "Refreshing %d Bosch objects with %d gateway reads.", len(plan), len(reads)
+        )
+        for planned in reads:
+            planned.snapshot()
+        results = await asyncio.gather(
+            *[
+                self._update_planned(planned, deadline, priority, **kwargs)
+                for planned in reads
+            ]
+        )
+        return [planned for planned, result in zip(reads, results) if result]
+
+    @staticmethod
+    def _entity_tier(component_type, entity) -> str:
+        """Return polling tier of entity."""
+        if getattr(entity.bosch_object, "interval", None):
+            return CUSTOM
+        if entity.entity_category == EntityCategory.DIAGNOSTIC:
+            return DIAGNOSTIC
+        return component_type
+
+    def _scheduler(self, tier: str, bosch_object) -> AdaptivePollScheduler | None:
+        """Return poll scheduler of object in tier.
+
+        Custom path objects are polled with fixed interval of their own,
+        checked by timer of the shortest custom interval.
+        """
+        if tier != CUSTOM:
+            return self._poll_schedulers.get(tier)
+        key = f"{CUSTOM}_{bosch_object.interval}"
+        if key not in self._poll_schedulers:
+            interval = timedelta(seconds=bosch_object.interval)
+            self._poll_schedulers[key] = AdaptivePollScheduler(
+                base_interval=interval,
+                max_interval=interval,
+                tick_interval=self.tier_intervals.get(CUSTOM),
+            )
+        return self._poll_schedulers[key]
+
+    async def components_update(
+        self,
+        component_types,
+        event_time=None,
+        force: bool = False,
+        tiers=None,
+        entity_ids: set[str] | None = None,
+    ) -> list:
+        """Update data of many platforms concurrently.
 
-    async def thermostat_refresh(self, event_time=None):
-        """Call Bosch to refresh information."""
-        if self._update_lock.locked():
-            _LOGGER.debug("Update already in progress. Not updating.")
+        Objects are fetched in parallel limited by gateway concurrency,
+        once all fetches are done only entities of changed objects are notified.
+        Unless forced, only objects due by adaptive schedule of their tier
+        and not backed off after failures are read, and the cycle is limited
+        by time and request budget. Circuits with schedule are read shortly
+        after each switchpoint and less often between them.
+        """
+        now = time.monotonic()
+        plan = RefreshPlan()
+        schedulers = {}
+        for component_type in component_types:
+            if component_type not in self.supported_platforms:
+                continue
+            for entity in self.hass.data[DOMAIN][self.uuid].get(component_type, []):
+                if not entity.enabled:
+                    continue
+                if entity_ids is not None and entity.entity_id not in entity_ids:
+                    continue
+                tier = self._entity_tier(component_type, entity)
+                if tiers is not None and tier not in tiers:
+                    continue
+                key = object_key(entity.bosch_object)
+                scheduler = self._scheduler(tier, entity.bosch_object)
+                if not force and (
+                    not scheduler
+                    or not scheduler.is_due(key, now)
+                    or not self.failures.is_allowed(key, now)
+                ):
+                    continue
+                if scheduler:
+                    schedulers.setdefault(key, scheduler)
+                plan.add(
+                    component_type,
+                    entity,
+                    LOWEST_PRIORITY
+                    if getattr(entity, "_circuit_type", None) == DV
+                    else TIER_PRIORITIES[tier],
+                )
+        updated = []
+        changed = 0
+        for planned in await self._execute_plan(
+            plan, budgeted=not force, priority=INTERACTIVE if force else POLL
+        ):
+            for read in planned.reads:
+                if read.key in schedulers:
+                    schedulers[read.key].record(read.key, read.changed)
+                    self._align_to_schedule(schedulers[read.key], read)
+                if not read.changed and read.key in self._notified_objects:
+                    continue
+                self._notified_objects.add(read.key)
+                changed += 1
+                for component_type, _ in read.dependents:
+                    if component_type not in updated:
+                        updated.append(component_type)
+                async_dispatcher_send(
+                    self.hass, object_signal(read.bosch_object, self.uuid)
+                )
+        _LOGGER.debug(
+            "Bosch %s entities updated, %d objects changed.", updated, changed
+        )
+        if changed and self._save_states:
+            self._state_store.async_delay_save(self._persisted_states, STATE_SAVE_DELAY)
+        return updated
+
+    @staticmethod
+    def _align_to_schedule(scheduler: AdaptivePollScheduler, read) -> None:
+        """Poll circuit right after switchpoints of its schedule, relax between."""
+        try:
+            schedule = getattr(read.bosch_object, "schedule", None)
+        except NotImplementedError:
+            return
+        now = gateway_time(schedule) or dt_util.now()
+        seconds = seconds_to_switchpoint(schedule, now)
+        if seconds is not None:
+            scheduler.align_to_switchpoint(read.key, seconds)
+
+    def restored_state(self, unique_id: str | None) -> dict | None:
+        """Return last known state of entity from previous run."""
+        return self._restored_states.get(unique_id) if unique_id else None
+
+    async def async_save_states(self) -> None:
+        """Store last known states now and stop delayed saves.
+
+        Called on unload while entities are still in hass.data.
+        """
+        self._save_states = False
+        await self._state_store.async_save(self._persisted_states())
+
+    @callback
+    def _persisted_states(self) -> dict:
+        """Collect last known states of entities to store."""
+        states = {}
+        data = self.hass.data[DOMAIN].get(self.uuid, {})
+        for platform in REFRESH_PLATFORMS:
+            for entity in data.get(platform, []):
+                if entity.unique_id and (state := entity.persisted_state()):
+                    states[entity.unique_id] = state
+        return states
+
+    async def tier_refresh(self, tiers, event_time=None):
+        """Refresh objects of given polling tiers which are due."""
+        await self.thermostat_refresh(event_time, tiers=tiers)
+
+    async def thermostat_refresh(self, event_time=None, force: bool = False, tiers=None):
+        """Call Bosch to refresh information.
+
+        Scheduled refresh reads only objects due by adaptive schedule,
+        forced one reads all of them. Tiers requested while update is in
+        progress are refreshed in one trailing update right after it.
+        """
+        self._pending_tiers |= (
+            set(tiers) if tiers is not None else set(self.tier_intervals)
+        )
+        self._pending_force |= force
+        await self.request_queue.coalesce(
+            "thermostat_refresh", partial(self._refresh_pending, event_time)
+        )
+
+    async def _refresh_pending(self, event_time=None) -> None:
+        """Refresh all tiers requested so far."""
+        tiers, self._pending_tiers = self._pending_tiers, set()
+        force, self._pending_force = self._pending_force, False
+        if not tiers:
             return
         _LOGGER.debug("Updating Bosch thermostat entitites.")
-        async with self._update_lock:
-            await self.component_update(SENSOR, event_time)
-            await self.component_update(BINARY_SENSOR, event_time)
-            await self.component_update(CLIMATE, event_time)
-            await self.component_update(WATER_HEATER, event_time)
-            await self.component_update(SWITCH, event_time)
-            await self.component_update(NUMBER, event_time)
-            _LOGGER.debug("Finish updating entities. Waiting for next scheduled check.")
+        await self.components_update(REFRESH_PLATFORMS, event_time, force, tiers)
+        _LOGGER.debug("Finish updating entities. Waiting for next scheduled check.")
+
+    async def async_request_refresh(
+        self,
+        entity_ids: list[str] | None = None,
+        platforms: list[str] | None = None,
+    ) -> None:
+        """Request refresh from service.
+
+        Requests are debounced: first one runs immediately, ones made within
+        cooldown are merged into single trailing refresh. Without entities
+        and platforms all entities are refreshed.
+        """
+        if not entity_ids and not platforms:
+            self._manual_all = True
+        self._manual_targets.update(entity_ids or [])
+        self._manual_targets.update(
+            entity.entity_id
+            for platform in platforms or []
+            for entity in self.hass.data[DOMAIN][self.uuid].get(platform, [])
+            if entity.entity_id
+        )
+        await self._refresh_debouncer.async_call()
+
+    async def async_request_recordings_refresh(self) -> None:
+        """Request debounced refresh of recording sensors from service."""
+        await self._recording_debouncer.async_call()
+
+    async def _manual_refresh(self) -> None:
+        """Refresh entities requested since last manual refresh."""
+        refresh_all, self._manual_all = self._manual_all, False
+        targets, self._manual_targets = self._manual_targets, set()
+        try:
+            if refresh_all:
+                await self.thermostat_refresh(force=True)
+            elif targets:
+                _LOGGER.debug("Refreshing Bosch entities %s on request.", targets)
+                await self.components_update(
+                    REFRESH_PLATFORMS, force=True, entity_ids=targets
+                )
+        finally:
+            if self._manual_all or self._manual_targets:
+                # Debouncer drops calls made while refresh runs. Call it again
+                # once this one finished, so they run as trailing refresh.
+                self.hass.async_create_task(self._refresh_debouncer.async_call())
+
+    @callback
+    def async_confirm_write(self, entity, check=None, done=None) -> None:
+        """Read object written by entity again until gateway reflects the write.
+
+        Newer write of the same object restarts confirmation, which then
+        waits for checks of all pending writes of the object. Done callback
+        of each write gets result of its confirmation.
+        """
+        key = object_key(entity.bosch_object)
+        self._confirm_waiters.setdefault(key, []).append((check, done))
+        task = self._confirm_tasks.pop(key, None)
+        if task:
+            task.cancel()
+        self._confirm_tasks[key] = self.hass.async_create_task(
+            self._confirm_write(entity, key)
+        )
+
+    def _settle_waiters(self, key: str, final: bool = False) -> bool:
+        """Report writes which passed their checks, return if all did.
+
+        Final call reports remaining writes as unconfirmed.
+        """
+        remaining = []
+        for check, done in self._confirm_waiters.pop(key, []):
+            if check is None or check():
+                if done:
+                    done(True)
+            elif final:
+                if done:
+                    done(False)
+            else:
+                remaining.append((check, done))
+        if remaining:
+            self._confirm_waiters[key] = remaining
+        return not remaining
+
+    async def _confirm_write(self, entity, key: str) -> None:
+        platform = entity.platform.domain
+        tier = self._entity_tier(platform, entity)
+        try:
+            for delay in WRITE_CONFIRM_DELAYS:
+                await asyncio.sleep(delay)
+                plan = RefreshPlan()
+                plan.add(platform, entity, TIER_PRIORITIES.get(tier, LOWEST_PRIORITY))
+                if not await self._execute_plan(plan, priority=INTERACTIVE):
+                    continue
+                async_dispatcher_send(
+                    self.hass, object_signal(entity.bosch_object, self.uuid)
+                )
+                if self._settle_waiters(key):
+                    _LOGGER.debug("Write to %s confirmed by gateway.", key)
+                    break
+            else:
+                _LOGGER.debug("Gateway didn't confirm write to %s.", key)
+                self._settle_waiters(key, final=True)
+            scheduler = self._scheduler(tier, entity.bosch_object)
+            if scheduler:
+                scheduler.expedite(key)
+        finally:
+            if self._confirm_tasks.get(key) is asyncio.current_task():
+                del self._confirm_tasks[key]
 
     async def firmware_refresh(self, event_time=None):
         """Call Bosch to refresh firmware info."""
-        if self._update_lock.locked():
-            _LOGGER.debug("Update already in progress. Not updating.")
-            return
+        await self.request_queue.coalesce("firmware_refresh", self._firmware_check)
+
+    async def _firmware_check(self) -> None:
         _LOGGER.debug("Updating info about Bosch firmware.")
         try:
-            async with self._update_lock:
-                await self.gateway.check_firmware_validity()
+            await self.gateway_call(
+                self.gateway.check_firmware_validity, priority=BACKGROUND
+            )
         except FirmwareException as err:
             create_notification_firmware(hass=self.hass, msg=err)
 
-    async def make_rawscan(self, filename: str) -> dict:
-        """Create rawscan from service."""
-        rawscan = {}
-        async with self._update_lock:
-            _LOGGER.info("Starting rawscan of Bosch component")
-            async_create_persistent_notification(
-                self.hass,
-                title="Bosch scan",
-                message=("Starting rawscan"),
-                notification_id=NOTIFICATION_ID,
-            )
-            rawscan = await self.gateway.rawscan()
-            try:
-                save_json(filename, rawscan)
-            except (FileNotFoundError, OSError) as err:
-                _LOGGER.error("Can't create file. %s", err)
-                if rawscan:
-                    return rawscan
-            url = "{}{}{}".format(
-                get_url(self.hass),
-                "/local/bosch_scan.json?v",
-                random.randint(0, 5000),
+    async def make_rawscan(
+        self,
+        filename: str,
+        compress: bool = False,
+        path: str | None = None,
+        incremental: bool = False,
+    ) -> dict:
+        """Create rawscan from service and return its summary.
+
+        Scan runs as background task, so polling goes on meanwhile.
+        Calls made while scan is running wait for that scan.
+        Scan limited to path is saved next to full scan, so full scan
+        stays the baseline which every scan is compared with.
+        """
+        if self._scan_task and not self._scan_task.done():
+            _LOGGER.info("Rawscan already in progress, waiting for it.")
+        else:
+            self._scan_task = self.hass.async_create_task(
+                self._rawscan(filename, compress, path, incremental)
             )
-            _LOGGER.info(f"Rawscan success. Your URL: {url}")
-            async_create_persistent_notification(
-                self.hass,
-                title="Bosch scan",
-                message=(f"[{url}]({url})"),
-                notification_id=NOTIFICATION_ID,
+        try:
+            return await asyncio.shield(self._scan_task)
+        except asyncio.CancelledError:
+            if not self._scan_task.cancelled():
+                raise
+            return {"cancelled": True}
+
+    def cancel_rawscan(self) -> bool:
+        """Cancel running rawscan."""
+        if not self._scan_task or self._scan_task.done():
+            return False
+        _LOGGER.info("Cancelling rawscan of Bosch component")
+        self._scan_task.cancel()
+        return True
+
+    def _load_previous_scan(
+        self, filename: str, roots: list[str] | None = None
+    ) -> dict[str, dict] | None:
+        """Load latest of plain and gzipped full scan."""
+        candidates = [
+            name for name in (filename, f"{filename}.gz") if os.path.exists(name)
+        ]
+        if not candidates:
+            return None
+        latest = max(candidates, key=os.path.getmtime)
+        try:
+            return load_scan(latest, roots)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Can't read previous scan %s. %s", latest, err)
+            return None
+
+    async def _rawscan(
+        self,
+        filename: str,
+        compress: bool,
+        path: str | None = None,
+        incremental: bool = False,
+    ) -> dict:
+        _LOGGER.info("Starting rawscan of Bosch component")
+        previous = None
+        # Full scan is only streamed, previous one is compared to subtree
+        # or incremental scans, so two full scans aren't held in memory.
+        if incremental or path:
+            previous = await self.hass.async_add_executor_job(
+                self._load_previous_scan, filename, [path] if path else None
             )
-        return rawscan
+        if incremental and previous is None:
+            _LOGGER.info("No previous scan found, making full one.")
+        if path:
+            name, ext = os.path.splitext(filename)
+            filename = f"{name}_partial{ext}"
+        if compress:
+            filename = f"{filename}.gz"
+        scanner = GatewayScanner(
+            self.hass,
+            partial(self.gateway_call, self.gateway.raw_query, priority=BACKGROUND),
+            roots=[path] if path else None,
+        )
+        writer = ScanWriter(self.hass, filename, filename.endswith(".gz"))
+        try:
+            await writer.async_open()
+        except OSError as err:
+            _LOGGER.error("Can't create file. %s", err)
+            return {"error": str(err)}
+        try:
+            found = await scanner.async_scan(writer, previous, incremental)
+            size = await writer.async_close()
+        except asyncio.CancelledError:
+            await writer.async_abort()
+            scanner.notify(f"Rawscan cancelled after {scanner.requests} requests.")
+            raise
+        except OSError as err:
+            _LOGGER.error("Can't write file. %s", err)
+            await writer.async_abort()
+            return {"error": str(err)}
+        except BaseException:
+            await writer.async_abort()
+            raise
+        url = "{}/local/{}?v{}".format(
+            get_url(self.hass),
+            os.path.basename(filename),
+            random.randint(0, 5000),
+        )
+        _LOGGER.info(f"Rawscan success. Your URL: {url}")
+        scanner.notify(f"[{url}]({url})")
+        summary = {
+            "url": url,
+            "requests": scanner.requests,
+            "entries": sum(found.values()),
+            "size": size,
+            "paths": found,
+        }
+        if previous is not None:
+            summary["diff"] = scan_diff(previous, scanner.entries, list(found))
+        return summary
 
     async def async_reset(self) -> bool:
         """Reset this device to default state."""
@@ -502,5 +1061,13 @@ class BoschGatewayEntry:
             for platform in self.supported_platforms
         ]
         unload_ok = await asyncio.gather(*tasks)
+        # Also drops trailing refresh queued by manual refresh in progress.
+        self._refresh_debouncer.async_shutdown()
+        self._recording_debouncer.async_cancel()
+        for task in self._confirm_tasks.values():
+            task.cancel()
+        self._confirm_waiters.clear()
+        self.write_queue.cancel()
+        self.cancel_rawscan()
         await self.gateway.close(force=False)
         return all(unload_ok)
@@ -5,7 +5,7 @@ from bosch_thermostat_client.const import BINARY, ON, USED
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschEntity
+from .bosch_entity import BoschEntity, gateway_signal
 from .const import (
     BINARY_SENSOR,
     DOMAIN,
@@ -40,7 +40,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             )
 
     async_add_entities(data[BINARY_SENSOR])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
 
 
@@ -49,6 +49,7 @@ class BoschBinarySensor(BoschEntity, BinarySensorEntity):
 
     signal = SIGNAL_BINARY_SENSOR_UPDATE_BOSCH
     _domain_name = "Sensors"
+    _persisted_attrs = ("_attr_is_on", "_attrs")
 
     def __init__(
         self,
@@ -68,7 +69,6 @@ class BoschBinarySensor(BoschEntity, BinarySensorEntity):
         self._name = name
         self._attr_uri = attr_uri
         self._state = None
-        self._update_init = True
 
         self._attr_unique_id = f"{self._domain_name}{self._name}{self._uuid}"
         self._attrs = {}
@@ -77,7 +77,7 @@ class BoschBinarySensor(BoschEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
-        return self._attrs
+        return self._mark_stale(self._attrs)
 
     @property
     def device_name(self):
@@ -99,13 +99,14 @@ class BoschBinarySensor(BoschEntity, BinarySensorEntity):
             return False
 
         self._attr_is_on = get_on_attr()
-
-        self._attrs["stateExtra"] = self._bosch_object.state_message
-        self.attrs_write(data=self._bosch_object.get_property(self._attr_uri))
+        self.attrs_write(
+            data={
+                **self._bosch_object.get_property(self._attr_uri),
+                "stateExtra": self._bosch_object.state_message,
+            }
+        )
 
     def attrs_write(self, data):
         """Write entity attributes."""
-        self._attrs = data
-        if self._update_init:
-            self._update_init = False
-            self.async_schedule_update_ha_state()
+        self._attrs = self.filter_attributes(data)
+        self.async_write_state_if_changed()
@@ -1,13 +1,50 @@
 """Bosch base entity."""
+import asyncio
+import json
+import logging
+from functools import partial
+
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from .const import DEFAULT_MAX_TEMP, DEFAULT_MIN_TEMP, DOMAIN
+from .const import (
+    BOSCH_GATEWAY_ENTRY,
+    CONF_EXPOSED_ATTRIBUTES,
+    CONF_OPTIMISTIC_MODE,
+    DEFAULT_MAX_TEMP,
+    DEFAULT_MIN_TEMP,
+    DOMAIN,
+    RAW_ATTRIBUTES,
+    SIGNAL_OBJECT_UPDATE_BOSCH,
+    STALE,
+    UNRECORDED_ATTRIBUTES,
+)
 from homeassistant.helpers.entity import DeviceInfo
+from .refresh import object_key
+from .write_queue import SUPERSEDED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def gateway_signal(signal: str, uuid: str) -> str:
+    """Return dispatcher signal scoped to single gateway."""
+    return f"{signal}_{uuid}"
+
+
+def object_signal(bosch_object, uuid: str) -> str:
+    """Return dispatcher signal of single Bosch object in gateway."""
+    return gateway_signal(
+        f"{SIGNAL_OBJECT_UPDATE_BOSCH}_{object_key(bosch_object)}", uuid
+    )
 
 
 class BoschEntity:
     """Bosch base entity class."""
 
+    _attr_should_poll = False
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+    _persisted_attrs: tuple[str, ...] = ("_state",)
+
     def __init__(self, **kwargs):
         """Initialize the entity."""
         if not hasattr(self, "_domain_name"):
@@ -16,12 +53,34 @@ class BoschEntity:
         self._bosch_object = kwargs.get("bosch_object")
         self._gateway = kwargs.get("gateway")
         self._uuid = kwargs.get("uuid")
+        self._written_snapshot = None
+        # Written values and if they are shown optimistically, per write
+        # waiting for confirmation.
+        self._writes: dict[object, tuple[dict, bool]] = {}
+        self._restored = {}
 
     @property
     def name(self):
         """Return the name of the entity."""
         return self._name
 
+    @property
+    def gateway_entry(self):
+        """Return Bosch gateway entry this entity belongs to."""
+        return self.hass.data[DOMAIN][self._uuid][BOSCH_GATEWAY_ENTRY]
+
+    def filter_attributes(self, data: dict) -> dict:
+        """Drop raw gateway fields which are not chosen in options."""
+        exposed = self.gateway_entry.config_entry.options.get(CONF_EXPOSED_ATTRIBUTES)
+        if exposed is None:
+            return data
+
+        def is_exposed(key: str) -> bool:
+            field = "state" if key.startswith("state_") else key
+            return field not in RAW_ATTRIBUTES or field in exposed
+
+        return {key: value for key, value in data.items() if is_exposed(key)}
+
     @property
     def bosch_object(self):
         """Return upstream component. Used for refreshing."""
@@ -29,10 +88,187 @@ class BoschEntity:
 
     async def async_added_to_hass(self):
         """Register callbacks."""
+        self._restore_state(self.gateway_entry.restored_state(self.unique_id))
         self.async_on_remove(
-            async_dispatcher_connect(self.hass, self.signal, self.async_update)
+            async_dispatcher_connect(
+                self.hass, gateway_signal(self.signal, self._uuid), self.async_update
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                object_signal(self._bosch_object, self._uuid),
+                self.async_update,
+            )
+        )
+
+    def _restore_state(self, data: dict | None) -> None:
+        """Show last known state until object is read from gateway."""
+        if not data or self._bosch_object_read:
+            return
+        self._restored = {
+            attr: value for attr, value in data.items() if attr in self._persisted_attrs
+        }
+        for attr, value in self._restored.items():
+            setattr(self, attr, value)
+
+    @property
+    def _bosch_object_read(self) -> bool:
+        return getattr(self._bosch_object, "update_initialized", True)
+
+    def persisted_state(self) -> dict | None:
+        """Return state to keep across restarts."""
+        if self._restored:
+            return self._restored
+        if not self._persisted_attrs or not self._bosch_object_read:
+            return None
+        data = {}
+        for attr in self._persisted_attrs:
+            value = getattr(self, attr, None)
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            data[attr] = value
+        return data
+
+    def _mark_stale(self, attributes: dict) -> dict:
+        """Mark restored state which gateway didn't confirm yet."""
+        return {**attributes, STALE: True} if self._restored else attributes
+
+    @property
+    def extra_state_attributes(self):
+        """Return the optional state attributes."""
+        return self._mark_stale({}) or None
+
+    def _state_snapshot(self) -> str:
+        """Compact snapshot of state and attributes as written to HA.
+
+        Capabilities like operation or HVAC mode lists and min/max values,
+        features, unit and name are written with state too.
+        """
+        return json.dumps(
+            [
+                self.available,
+                self.state,
+                self.state_attributes,
+                self.extra_state_attributes,
+                self.capability_attributes,
+                self.supported_features,
+                self.unit_of_measurement,
+                self.name,
+            ],
+            sort_keys=True,
+            default=str,
         )
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write state to HA and remember what was written."""
+        self._written_snapshot = self._state_snapshot()
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_state_if_changed(self) -> bool:
+        """Write state to HA only if it changed since last write.
+
+        Restored state is kept until object is read from gateway, optimistic
+        values waiting for confirmation win over read state.
+        """
+        if self._restored and self._bosch_object_read:
+            self._restored = {}
+        pinned = dict(self._restored)
+        for values, optimistic in self._writes.values():
+            if optimistic:
+                pinned.update(values)
+        for attr, value in pinned.items():
+            setattr(self, attr, value)
+        if self._state_snapshot() == self._written_snapshot:
+            return False
+        self.async_write_ha_state()
+        return True
+
+    @property
+    def optimistic_mode(self) -> bool:
+        """Return if written values are shown before gateway confirms them."""
+        return self.gateway_entry.config_entry.options.get(CONF_OPTIMISTIC_MODE, False)
+
+    async def async_write_value(
+        self, write, values=None, check=None, debounce: bool = False
+    ) -> bool:
+        """Send write to gateway, return if it succeeded.
+
+        In optimistic mode values (entity attribute: written value) are shown
+        at once and kept until read of object confirms the write. They are
+        rolled back if write fails or gateway doesn't reflect it.
+        Debounced write is sent only if no newer value of the same
+        attributes comes within debounce delay.
+        """
+        values = dict(values or {})
+        for written, _ in self._writes.values():
+            # Newer write supersedes older writes of the same attributes.
+            for attr in values:
+                written.pop(attr, None)
+        token = object()
+        optimistic = bool(values) and self.optimistic_mode
+        self._writes[token] = (values, optimistic)
+        if optimistic:
+            self.async_write_state_if_changed()
+        gateway_entry = self.gateway_entry
+        try:
+            if debounce:
+                result = await gateway_entry.write_queue.write(
+                    f"{object_key(self._bosch_object)}:{','.join(values)}",
+                    partial(gateway_entry.gateway_call, write),
+                )
+            else:
+                result = await gateway_entry.gateway_call(write)
+        except asyncio.CancelledError:
+            self._async_end_write(token)
+            raise
+        except Exception as err:
+            self._async_end_write(token, f"Write to {self.name} failed: {err}")
+            raise
+        if result is SUPERSEDED:
+            self._writes.pop(token, None)
+            return True
+        if result is False or (type(result) is int and result <= 0):
+            self._async_end_write(token, f"Write to {self.name} failed")
+            return False
+
+        def confirmed() -> bool:
+            # Write fully superseded by newer one needs no confirmation.
+            return not self._writes.get(token, ({},))[0] or (
+                check is None or check()
+            )
+
+        self.gateway_entry.async_confirm_write(
+            self, confirmed, done=partial(self._async_write_confirmed, token)
+        )
+        return True
+
+    @callback
+    def _async_write_confirmed(self, token: object, confirmed: bool) -> None:
+        """Drop values of confirmed write, roll back unconfirmed one."""
+        values = self._writes.get(token, ({}, False))[0]
+        self._async_end_write(
+            token,
+            None
+            if confirmed or not values
+            else f"Gateway didn't confirm {values} of {self.name}",
+        )
+
+    @callback
+    def _async_end_write(self, token: object, failure: str | None = None) -> None:
+        """Stop waiting for write and show read state instead of its values."""
+        values, optimistic = self._writes.pop(token, ({}, False))
+        if failure:
+            _LOGGER.warning(
+                "%s%s.", failure, ", rolling back" if values and optimistic else ""
+            )
+        if values and optimistic:
+            self.hass.async_create_task(self.async_update())
+
     @property
     def _domain_identifier(self):
         if self._bosch_object.parent_id:
@@ -56,6 +292,8 @@ class BoschEntity:
 class BoschClimateWaterEntity(BoschEntity):
     """Bosch climate and water entities base class."""
 
+    _persisted_attrs = ("_state", "_target_temperature", "_current_temperature")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._name = self._bosch_object.name
@@ -0,0 +1,54 @@
+"""Response cache of Bosch gateway paths."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_CACHED_PATHS = 256
+
+
+class ResponseCache:
+    """Keep raw gateway responses of paths for ttl seconds.
+
+    Least recently used path is evicted when cache holds max_size paths.
+    """
+
+    def __init__(self, ttl: float, max_size: int = MAX_CACHED_PATHS) -> None:
+        """Initialize cache."""
+        self._ttl = ttl
+        self._max_size = max_size
+        self._responses: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if cache keeps anything."""
+        return self._ttl > 0
+
+    def get(self, path: str, now: float | None = None) -> Any | None:
+        """Return fresh response of path or None."""
+        cached = self._responses.get(path)
+        if cached is None:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - cached[0] > self._ttl:
+            del self._responses[path]
+            return None
+        self._responses.move_to_end(path)
+        return cached[1]
+
+    def set(self, path: str, response: Any, now: float | None = None) -> None:
+        """Store response of path."""
+        if not self.enabled or response is None:
+            return
+        self._responses[path] = (time.monotonic() if now is None else now, response)
+        self._responses.move_to_end(path)
+        while len(self._responses) > self._max_size:
+            self._responses.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Forget response of path."""
+        self._responses.pop(path, None)
@@ -1,6 +1,7 @@
 """Support for Bosch Thermostat Climate."""
 from __future__ import annotations
 import logging
+from functools import partial
 from typing import Any
 
 from bosch_thermostat_client.const import HVAC_HEAT, HVAC_OFF, SETPOINT
@@ -12,7 +13,7 @@ from homeassistant.components.climate.const import (
 from homeassistant.const import ATTR_TEMPERATURE
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschClimateWaterEntity
+from .bosch_entity import BoschClimateWaterEntity, gateway_signal
 from .const import (
     BOSCH_STATE,
     CLIMATE,
@@ -32,19 +33,17 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Bosch thermostat from a config entry."""
     uuid = config_entry.data[UUID]
     data = hass.data[DOMAIN][uuid]
-    optimistic_mode = config_entry.options.get("optimistic_mode", False)
     data[CLIMATE] = [
         BoschThermostat(
             hass=hass,
             uuid=uuid,
             bosch_object=hc,
             gateway=data[GATEWAY],
-            optimistic_mode=optimistic_mode,
         )
         for hc in data[GATEWAY].heating_circuits
     ]
     async_add_entities(data[CLIMATE])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
 
 
@@ -52,10 +51,13 @@ class BoschThermostat(BoschClimateWaterEntity, ClimateEntity):
     """Representation of a Bosch thermostat."""
 
     signal = SIGNAL_CLIMATE_UPDATE_BOSCH
+    _persisted_attrs = BoschClimateWaterEntity._persisted_attrs + (
+        "_hvac_mode",
+        "_hvac_modes",
+        "_preset_mode",
+    )
 
-    def __init__(
-        self, hass, uuid, bosch_object, gateway, optimistic_mode: bool = False
-    ) -> None:
+    def __init__(self, hass, uuid, bosch_object, gateway) -> None:
         """Initialize the thermostat."""
         self._name_prefix = (
             "Zone circuit " if "/zones" in bosch_object.attr_id else "Heating circuit "
@@ -63,7 +65,7 @@ class BoschThermostat(BoschClimateWaterEntity, ClimateEntity):
         self._mode = {}
         self._hvac_modes = []
         self._hvac_mode = None
-        self._optimistic_mode = optimistic_mode
+        self._preset_mode = None
         self._is_enabled = True
 
         super().__init__(
@@ -97,28 +99,22 @@ class BoschThermostat(BoschClimateWaterEntity, ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode):
         """Set operation mode."""
         _LOGGER.debug(f"Setting operation mode {hvac_mode}.")
-
-        if self._optimistic_mode:
-            _old_hvac_mode = self._bosch_object.ha_mode
-            self._hvac_mode = hvac_mode
-            self.schedule_update_ha_state()
-        status = await self._bosch_object.set_ha_mode(hvac_mode)
-        if status > 0:
-            return True
-        if self._optimistic_mode:
-            """If fail revert back to mode it was back then."""
-            self._hvac_mode = _old_hvac_mode
-            self.schedule_update_ha_state()
-        return False
+        return await self.async_write_value(
+            partial(self._bosch_object.set_ha_mode, hvac_mode),
+            {"_hvac_mode": hvac_mode},
+            lambda: self._bosch_object.ha_mode == hvac_mode,
+        )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         _LOGGER.debug(f"Setting target temperature {temperature}.")
-        await self._bosch_object.set_temperature(temperature)
-        if self._optimistic_mode:
-            self._target_temperature = temperature
-            self.schedule_update_ha_state()
+        await self.async_write_value(
+            partial(self._bosch_object.set_temperature, temperature),
+            {"_target_temperature": temperature},
+            lambda: self._bosch_object.target_temperature == temperature,
+            debounce=True,
+        )
 
     @property
     def hvac_mode(self):
@@ -147,11 +143,15 @@ class BoschThermostat(BoschClimateWaterEntity, ClimateEntity):
     @property
     def preset_mode(self):
         """Return current preset mode."""
-        return self._bosch_object.preset_mode
+        return self._preset_mode
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new target preset mode."""
-        await self._bosch_object.set_preset_mode(preset_mode)
+        await self.async_write_value(
+            partial(self._bosch_object.set_preset_mode, preset_mode),
+            {"_preset_mode": preset_mode},
+            lambda: self._bosch_object.preset_mode == preset_mode,
+        )
 
     async def async_update(self):
         """Update state of device."""
@@ -159,16 +159,10 @@ class BoschThermostat(BoschClimateWaterEntity, ClimateEntity):
         if not self._bosch_object or not self._bosch_object.update_initialized:
             return
         self._temperature_units = UNITS_CONVERTER.get(self._bosch_object.temp_units)
-        if (
-            self._state != self._bosch_object.state
-            or self._target_temperature != self._bosch_object.target_temperature
-            or self._current_temperature != self._bosch_object.current_temp
-            or self._hvac_modes != self._bosch_object.ha_modes
-            or self._hvac_mode != self._bosch_object.ha_mode
-        ):
-            self._state = self._bosch_object.state
-            self._target_temperature = self._bosch_object.target_temperature
-            self._current_temperature = self._bosch_object.current_temp
-            self._hvac_modes = self._bosch_object.ha_modes
-            self._hvac_mode = self._bosch_object.ha_mode
-            self.async_schedule_update_ha_state()
+        self._state = self._bosch_object.state
+        self._target_temperature = self._bosch_object.target_temperature
+        self._current_temperature = self._bosch_object.current_temp
+        self._hvac_modes = self._bosch_object.ha_modes
+        self._hvac_mode = self._bosch_object.ha_mode
+        self._preset_mode = self._bosch_object.preset_mode
+        self.async_write_state_if_changed()
@@ -15,17 +15,36 @@ from bosch_thermostat_client.exceptions import (
 )
 from homeassistant import config_entries
 from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_ADDRESS, CONF_PASSWORD
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from . import create_notification_firmware
+from .sensor.custom import parse_custom_paths
 from .const import (
     ACCESS_KEY,
     ACCESS_TOKEN,
+    CONF_CUSTOM_GET_CACHE_TTL,
+    CONF_CUSTOM_PATHS,
+    CONF_CYCLE_REQUEST_BUDGET,
+    CONF_CYCLE_TIME_BUDGET,
     CONF_DEVICE_TYPE,
+    CONF_EXPOSED_ATTRIBUTES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_OPTIMISTIC_MODE,
     CONF_PROTOCOL,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_SCAN_INTERVALS,
+    DEFAULT_CUSTOM_GET_CACHE_TTL,
+    DEFAULT_CYCLE_REQUEST_BUDGET,
+    DEFAULT_CYCLE_TIME_BUDGET,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_REFRESH_CONCURRENCY,
+    DEFAULT_SCAN_INTERVALS,
     DOMAIN,
+    RAW_ATTRIBUTES,
     UUID,
 )
 
@@ -204,21 +223,95 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, entry: config_entries.ConfigEntry):
         """Initialize option."""
         self.entry = entry
+        self._options = {}
 
     async def async_step_init(self, user_input=None):
         """Display option dialog."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self._options.update(user_input)
+            return await self.async_step_intervals()
 
         new_stats_api = self.entry.options.get("new_stats_api", False)
-        optimistic_mode = self.entry.options.get("optimistic_mode", False)
+        optimistic_mode = self.entry.options.get(CONF_OPTIMISTIC_MODE, False)
+        refresh_concurrency = self.entry.options.get(
+            CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY
+        )
+        max_scan_interval = self.entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        custom_get_cache_ttl = self.entry.options.get(
+            CONF_CUSTOM_GET_CACHE_TTL, DEFAULT_CUSTOM_GET_CACHE_TTL
+        )
+        exposed_attributes = self.entry.options.get(
+            CONF_EXPOSED_ATTRIBUTES, RAW_ATTRIBUTES
+        )
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional("new_stats_api", default=new_stats_api): bool,
-                    vol.Optional("optimistic_mode", default=optimistic_mode): bool,
+                    vol.Optional(CONF_OPTIMISTIC_MODE, default=optimistic_mode): bool,
+                    vol.Optional(
+                        CONF_REFRESH_CONCURRENCY, default=refresh_concurrency
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL, default=max_scan_interval
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                    vol.Optional(
+                        CONF_CUSTOM_GET_CACHE_TTL, default=custom_get_cache_ttl
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_EXPOSED_ATTRIBUTES, default=exposed_attributes
+                    ): cv.multi_select({key: key for key in RAW_ATTRIBUTES}),
                 }
             ),
         )
+
+    async def async_step_intervals(self, user_input=None):
+        """Display polling intervals dialog."""
+        errors = {}
+        if user_input is not None:
+            try:
+                parse_custom_paths(user_input.get(CONF_CUSTOM_PATHS))
+            except ValueError as err:
+                _LOGGER.warning("%s", err)
+                errors[CONF_CUSTOM_PATHS] = "invalid_custom_paths"
+            else:
+                self._options.update(user_input)
+                return self.async_create_entry(title="", data=self._options)
+
+        schema = {
+            vol.Optional(
+                CONF_SCAN_INTERVALS[tier],
+                default=self.entry.options.get(
+                    CONF_SCAN_INTERVALS[tier], int(default.total_seconds())
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400))
+            for tier, default in DEFAULT_SCAN_INTERVALS.items()
+        }
+        schema[
+            vol.Optional(
+                CONF_CYCLE_TIME_BUDGET,
+                default=self.entry.options.get(
+                    CONF_CYCLE_TIME_BUDGET, DEFAULT_CYCLE_TIME_BUDGET
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=3600))
+        schema[
+            vol.Optional(
+                CONF_CYCLE_REQUEST_BUDGET,
+                default=self.entry.options.get(
+                    CONF_CYCLE_REQUEST_BUDGET, DEFAULT_CYCLE_REQUEST_BUDGET
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=1000))
+        schema[
+            vol.Optional(
+                CONF_CUSTOM_PATHS,
+                default=self.entry.options.get(CONF_CUSTOM_PATHS, ""),
+            )
+        ] = TextSelector(TextSelectorConfig(multiline=True))
+        return self.async_show_form(
+            step_id="intervals", data_schema=vol.Schema(schema), errors=errors
+        )
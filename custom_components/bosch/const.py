@@ -2,7 +2,7 @@
 from datetime import timedelta
 
 import voluptuous as vol
-from bosch_thermostat_client.const import DHW, HC, SC, ZN
+from bosch_thermostat_client.const import DHW, HC, NUMBER, SC, SELECT, SENSOR, ZN
 from bosch_thermostat_client.const.easycontrol import DV
 from homeassistant.const import UnitOfEnergy, UnitOfTemperature
 
@@ -36,6 +36,7 @@ SIGNAL_ENERGY_UPDATE_BOSCH = "bosch_energy_update"
 SIGNAL_SWITCH = "bosch_switch_update"
 SIGNAL_SELECT = "bosch_select_update"
 SIGNAL_NUMBER = "bosch_number_update"
+SIGNAL_OBJECT_UPDATE_BOSCH = "bosch_object_update"
 BOSCH_STATE = "bosch_state"
 
 START = "start"
@@ -46,7 +47,10 @@ SERVICE_CHARGE_START = "set_dhw_charge"
 SERVICE_PUT_STRING = "send_custom_put_string"
 SERVICE_PUT_FLOAT = "send_custom_put_float"
 SERVICE_GET = "send_custom_get"
+SERVICE_GET_BATCH = "send_custom_get_batch"
+SERVICE_PUT_BATCH = "send_custom_put_batch"
 SERVICE_DEBUG = "debug_scan"
+SERVICE_CANCEL_DEBUG = "cancel_debug_scan"
 SERVICE_UPDATE = "update_thermostat"
 RECORDING_SERVICE_UPDATE = "update_recordings_sensor"
 SERVICE_MOVE_OLD_DATA = "move_old_statistic_data"
@@ -85,6 +89,61 @@ INTERVAL = "interval"
 FW_INTERVAL = "fw_interval"
 RECORDING_INTERVAL = "recording_interval"
 
+CONF_REFRESH_CONCURRENCY = "refresh_concurrency"
+DEFAULT_REFRESH_CONCURRENCY = 3
+CONF_EXPOSED_ATTRIBUTES = "exposed_attributes"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 600
+# Seconds after write when written object is read again until gateway confirms it.
+WRITE_CONFIRM_DELAYS = (1, 2, 4, 8)
+# Seconds debounced write waits for newer value of the same path.
+WRITE_DEBOUNCE_DELAY = 1
+# Last known entity states kept across restarts.
+STATE_STORAGE_VERSION = 1
+STATE_SAVE_DELAY = 60
+STALE = "stale"
+# Minimum seconds between refreshes requested by services.
+MANUAL_REFRESH_COOLDOWN = 10
+CONF_OPTIMISTIC_MODE = "optimistic_mode"
+CONF_CUSTOM_GET_CACHE_TTL = "custom_get_cache_ttl"
+DEFAULT_CUSTOM_GET_CACHE_TTL = 0
+
+# Fields of raw gateway payload which might be exposed as entity attributes.
+# "state" stands for all state_* fields.
+RAW_ATTRIBUTES = [
+    "value",
+    "minValue",
+    "maxValue",
+    "allowedValues",
+    "unitOfMeasure",
+    "stepSize",
+    "writeable",
+    "used",
+    "status",
+    "timestamp",
+    "references",
+    "invalid",
+    "state",
+    "stateExtra",
+    "path",
+]
+# Attributes which don't change between reads or repeat entity state.
+# They are still visible in HA, but not stored by recorder.
+UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "value",
+        "minValue",
+        "maxValue",
+        "allowedValues",
+        "unitOfMeasure",
+        "stepSize",
+        "writeable",
+        "references",
+        "stateExtra",
+        "path",
+    }
+)
+
 CIRCUITS = [DHW, HC, SC, ZN, DV]
 CIRCUITS_SENSOR_NAMES = {
     DHW: "Water heater",
@@ -96,3 +155,39 @@ CIRCUITS_SENSOR_NAMES = {
 
 BINARY_SENSOR = "binary_sensor"
 LAST_RESET = "last_reset"
+
+# Polling tiers. Diagnostic entities are polled in own tier, whatever platform.
+DIAGNOSTIC = "diagnostic"
+DEFAULT_SCAN_INTERVALS = {
+    CLIMATE: SCAN_INTERVAL,
+    WATER_HEATER: SCAN_INTERVAL,
+    SENSOR: SCAN_INTERVAL,
+    BINARY_SENSOR: SCAN_INTERVAL,
+    SWITCH: SCAN_INTERVAL,
+    NUMBER: SCAN_INTERVAL,
+    SELECT: SCAN_INTERVAL,
+    DIAGNOSTIC: SCAN_SENSOR_INTERVAL,
+}
+# Option keys of tier intervals in seconds, 0 means manual refresh only.
+CONF_SCAN_INTERVALS = {tier: f"scan_interval_{tier}" for tier in DEFAULT_SCAN_INTERVALS}
+# Custom path sensors with own interval, see CONF_CUSTOM_PATHS.
+CUSTOM = "custom"
+CONF_CUSTOM_PATHS = "custom_paths"
+# Lower number is read first when cycle budget is limited.
+TIER_PRIORITIES = {
+    CLIMATE: 0,
+    WATER_HEATER: 0,
+    SWITCH: 1,
+    NUMBER: 1,
+    SELECT: 1,
+    SENSOR: 2,
+    BINARY_SENSOR: 2,
+    CUSTOM: 2,
+    DIAGNOSTIC: 3,
+}
+LOWEST_PRIORITY = 3
+
+CONF_CYCLE_TIME_BUDGET = "cycle_time_budget"
+DEFAULT_CYCLE_TIME_BUDGET = 50
+CONF_CYCLE_REQUEST_BUDGET = "cycle_request_budget"
+DEFAULT_CYCLE_REQUEST_BUDGET = 0
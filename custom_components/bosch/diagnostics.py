@@ -0,0 +1,28 @@
+"""Diagnostics support for Bosch thermostat."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import BOSCH_GATEWAY_ENTRY, DOMAIN, UUID
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    gateway_entry = hass.data[DOMAIN][entry.data[UUID]][BOSCH_GATEWAY_ENTRY]
+    failing = gateway_entry.failures.as_dict()
+    return {
+        "device_type": gateway_entry.gateway.device_type,
+        "firmware": gateway_entry.gateway.firmware,
+        "options": dict(entry.options),
+        "request_rate": round(gateway_entry.rate_limiter.rate, 2),
+        "request_errors": gateway_entry.rate_limiter.errors,
+        "quarantined_paths": [
+            path for path, state in failing.items() if state["quarantined"]
+        ],
+        "failing_paths": failing,
+    }
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from bosch_thermostat_client.const import GATEWAY, NUMBER
 from homeassistant.components.number import NumberEntity
 from homeassistant.components.number.const import NumberMode
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschEntity
+from .bosch_entity import BoschEntity, gateway_signal
 from .const import (
     CIRCUITS,
     CIRCUITS_SENSOR_NAMES,
@@ -57,7 +59,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 )
     data[NUMBER] = data_number
     async_add_entities(data[NUMBER])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
 
 
@@ -92,7 +94,6 @@ class BoschNumber(BoschEntity, NumberEntity):
         self._name = name
         self._attr_uri = attr_uri
         self._state = bosch_object.state
-        self._update_init = True
         self._attr_unique_id = f"{self._domain_name}{self._name}{self._uuid}"
         self._attrs = {}
         self._circuit_type = circuit_type
@@ -120,9 +121,9 @@ class BoschNumber(BoschEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the entity value."""
-        if self._bosch_object.state is None:
+        if self._state is None:
             return None
-        return float(self._bosch_object.state)
+        return float(self._state)
 
     @property
     def native_step(self) -> float:
@@ -143,11 +144,18 @@ class BoschNumber(BoschEntity, NumberEntity):
 
     async def async_update(self):
         """Update state of device."""
-        pass
+        self._state = self._bosch_object.state
+        self.async_write_state_if_changed()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        await self._bosch_object.set_value(value)
+        await self.async_write_value(
+            partial(self._bosch_object.set_value, value),
+            {"_state": value},
+            lambda: self._bosch_object.state is not None
+            and float(self._bosch_object.state) == value,
+            debounce=True,
+        )
 
 
 class CircuitNumber(BoschNumber):
@@ -0,0 +1,112 @@
+"""Rate limiter of requests sent to Bosch gateway."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from bosch_thermostat_client.exceptions import DeviceException
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_RATE = 2.0  # requests per second
+MIN_RATE = 0.2
+MAX_RATE = 10.0
+BURST = 5
+RATE_STEP = 0.1
+DECREASE_FACTOR = 0.5
+TARGET_LATENCY = 5.0  # seconds per request
+
+
+class GatewayRateLimiter:
+    """Token bucket shared by all requests of single gateway.
+
+    Rate is paced with AIMD: every fast successful call adds RATE_STEP
+    to the rate, every error or slow call multiplies it by DECREASE_FACTOR.
+    """
+
+    def __init__(
+        self,
+        rate: float = INITIAL_RATE,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        burst: int = BURST,
+    ) -> None:
+        """Initialize rate limiter."""
+        self._rate = rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.errors = 0
+
+    @property
+    def rate(self) -> float:
+        """Current rate of requests per second."""
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self, cost: int = 1) -> None:
+        """Wait until cost tokens are available and take them.
+
+        Cost larger than burst goes into debt, which next calls wait out.
+        """
+        needed = min(cost, self._burst)
+        async with self._lock:
+            self._refill()
+            while self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= cost
+
+    def _decrease(self) -> None:
+        self._rate = max(self._min_rate, self._rate * DECREASE_FACTOR)
+        _LOGGER.debug("Slowing down requests to Bosch gateway to %.2f/s.", self._rate)
+
+    def observe(self, latency: float, cost: int = 1) -> None:
+        """Adjust rate by latency of successful call."""
+        if latency / cost > TARGET_LATENCY:
+            self._decrease()
+            return
+        self._rate = min(self._max_rate, self._rate + RATE_STEP)
+
+    def observe_error(self) -> None:
+        """Adjust rate after failed call."""
+        self.errors += 1
+        self._decrease()
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        cost: int = 1,
+        failed: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Run gateway call once rate allows it.
+
+        Library swallows most gateway errors, so failed tells from result
+        if call failed anyway.
+        """
+        await self.acquire(cost)
+        start = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except (DeviceException, asyncio.TimeoutError):
+            self.observe_error()
+            raise
+        if failed is not None and failed(result):
+            self.observe_error()
+        else:
+            self.observe(time.monotonic() - start, cost)
+        return result
@@ -0,0 +1,268 @@
+"""Background raw scan of Bosch gateway."""
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import IO
+
+from bosch_thermostat_client.const import (
+    ENERGY_HISTORY_ENTRIES,
+    ID,
+    RECORDINGS,
+    REFERENCES,
+    ROOT_PATHS,
+)
+from bosch_thermostat_client.exceptions import DeviceException, EncryptionException
+from bosch_thermostat_client.helper import deep_into
+from homeassistant.components.persistent_notification import (
+    async_create as async_create_persistent_notification,
+)
+from homeassistant.core import HomeAssistant
+
+from .const import NOTIFICATION_ID
+
+_LOGGER = logging.getLogger(__name__)
+
+PROGRESS_EVERY = 25
+GATEWAY_LOGGER = "bosch_thermostat_client.gateway.base"
+# Set in task running scan, other gateway calls keep their errors logged.
+_SCANNING: ContextVar[bool] = ContextVar("bosch_scanning", default=False)
+
+
+def _in_scope(path: str, roots) -> bool:
+    return any(path == root or path.startswith(f"{root}/") for root in roots)
+
+
+def load_scan(filename: str, roots=None) -> dict[str, dict]:
+    """Load scan file and index its entries by gateway path.
+
+    With roots only entries under them are kept.
+    """
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(filename, "rt", encoding="utf-8") as file:
+        data = json.load(file)
+    entries = {}
+    for root in data:
+        if not isinstance(root, list):
+            continue
+        for entry in root:
+            if (
+                isinstance(entry, dict)
+                and ID in entry
+                and (roots is None or _in_scope(entry[ID], roots))
+            ):
+                entries[entry[ID]] = entry
+    return entries
+
+
+def scan_diff(previous: dict[str, dict], current: dict[str, dict], roots) -> dict:
+    """Compare entries of two scans under given root paths."""
+    before = {path for path in previous if _in_scope(path, roots)}
+    after = {path for path in current if _in_scope(path, roots)}
+    return {
+        "added": sorted(after - before),
+        "removed": sorted(before - after),
+        "changed": sorted(
+            path for path in before & after if previous[path] != current[path]
+        ),
+    }
+
+
+def _references(entry: dict) -> list[str]:
+    return [ref[ID] for ref in entry.get(REFERENCES, []) if ID in ref]
+
+
+def _is_series(path: str) -> bool:
+    """Check if entry is time series, which values change all the time."""
+    return RECORDINGS in path or ENERGY_HISTORY_ENTRIES in path
+
+
+class _MissingPathFilter(logging.Filter):
+    """Drop errors raw_query logs for paths gateway doesn't have.
+
+    Scan probes many such paths, scanner logs them at debug level itself.
+    Only queries sent by scan are affected.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.funcName != "raw_query" or not _SCANNING.get()
+
+
+class ScanWriter:
+    """Stream scan to JSON file root by root.
+
+    File is written in executor to temporary file, which replaces
+    target file only when scan is complete.
+    """
+
+    def __init__(self, hass: HomeAssistant, filename: str, compress: bool) -> None:
+        """Initialize writer."""
+        self.hass = hass
+        self.filename = filename
+        self._compress = compress
+        self._tmp = f"{filename}.part"
+        self._file: IO[str] | None = None
+        self._items = 0
+
+    def _open(self) -> None:
+        self._file = (
+            gzip.open(self._tmp, "wt", encoding="utf-8")
+            if self._compress
+            else open(self._tmp, "w", encoding="utf-8")
+        )
+        self._file.write("[")
+
+    def _write(self, data: str) -> None:
+        self._file.write(("," if self._items else "") + "\n" + data)
+        self._items += 1
+
+    def _close(self) -> int:
+        self._file.write("\n]\n")
+        self._file.close()
+        os.replace(self._tmp, self.filename)
+        return os.path.getsize(self.filename)
+
+    def _abort(self) -> None:
+        if self._file:
+            self._file.close()
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    async def async_open(self) -> None:
+        """Create temporary file."""
+        await self.hass.async_add_executor_job(self._open)
+
+    async def async_write(self, item) -> None:
+        """Append item to JSON list."""
+        await self.hass.async_add_executor_job(
+            self._write, json.dumps(item, default=str)
+        )
+
+    async def async_close(self) -> int:
+        """Finish file and return its size."""
+        return await self.hass.async_add_executor_job(self._close)
+
+    async def async_abort(self) -> None:
+        """Remove unfinished file."""
+        await self.hass.async_add_executor_job(self._abort)
+
+
+class GatewayScanner:
+    """Walk gateway tree one request at a time.
+
+    Every request is sent by query function, so it waits in gateway queue
+    like any other background job and polling keeps running meanwhile.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        query: Callable[[str], Awaitable[dict | None]],
+        roots: list[str] | None = None,
+    ) -> None:
+        """Initialize scanner."""
+        self.hass = hass
+        self._query = query
+        self._roots = roots or ROOT_PATHS
+        self._root = None
+        self._done = 0
+        self.requests = 0
+        self.entries: dict[str, dict] = {}
+
+    def notify(self, message: str) -> None:
+        """Show scan state in persistent notification."""
+        async_create_persistent_notification(
+            self.hass,
+            title="Bosch scan",
+            message=message,
+            notification_id=NOTIFICATION_ID,
+        )
+
+    def _notify_progress(self) -> None:
+        self.notify(
+            f"Scanning {self._root} ({self._done}/{len(self._roots)} paths done, "
+            f"{self.requests} requests sent)."
+        )
+
+    async def _get(self, path: str) -> dict:
+        result = await self._query(path)
+        self.requests += 1
+        if self.requests % PROGRESS_EVERY == 0:
+            self._notify_progress()
+        if result is None:
+            _LOGGER.debug("Path %s not found.", path)
+            raise DeviceException(f"Path {path} not found.")
+        return result
+
+    async def async_scan(
+        self,
+        writer: ScanWriter,
+        previous: dict[str, dict] | None = None,
+        incremental: bool = False,
+    ) -> dict:
+        """Scan all root paths into writer, return entries found per root.
+
+        Entries are kept for comparison only if previous scan is given.
+        Incremental scan reads only listings again, subtrees which listing
+        changed are scanned whole and other entries are reused.
+        """
+        gateway_logger = logging.getLogger(GATEWAY_LOGGER)
+        missing_path_filter = _MissingPathFilter()
+        gateway_logger.addFilter(missing_path_filter)
+        token = _SCANNING.set(True)
+        try:
+            return await self._scan_roots(writer, previous, incremental)
+        finally:
+            _SCANNING.reset(token)
+            gateway_logger.removeFilter(missing_path_filter)
+
+    async def _scan_roots(
+        self, writer: ScanWriter, previous: dict[str, dict] | None, incremental: bool
+    ) -> dict:
+        found = {}
+        for root in self._roots:
+            self._root = root
+            self._notify_progress()
+            _LOGGER.debug("Scanning Bosch path %s.", root)
+            if incremental and previous:
+                single_scan = []
+                await self._walk_changed(root, previous, single_scan)
+            else:
+                single_scan = await deep_into(root, [], self._get)
+            await writer.async_write(
+                single_scan if single_scan else {root: "not found"}
+            )
+            if previous is not None:
+                for entry in single_scan:
+                    if isinstance(entry, dict) and ID in entry:
+                        self.entries[entry[ID]] = entry
+            found[root] = len(single_scan)
+            self._done += 1
+        return found
+
+    async def _walk_changed(
+        self, path: str, previous: dict[str, dict], entries: list
+    ) -> None:
+        old = previous.get(path)
+        if not old or REFERENCES not in old:
+            await deep_into(path, entries, self._get)
+            return
+        try:
+            listing = await self._get(path)
+        except (DeviceException, EncryptionException):
+            return
+        if _references(listing) != _references(old):
+            _LOGGER.debug("Listing of %s changed, scanning it again.", path)
+            await deep_into(path, entries, self._get)
+            return
+        entries.append(old)
+        for child in _references(old):
+            entry = previous.get(child)
+            if entry is None or REFERENCES in entry or _is_series(child):
+                await self._walk_changed(child, previous, entries)
+            else:
+                entries.append(entry)
@@ -0,0 +1,231 @@
+"""Refresh planning of Bosch objects."""
+from __future__ import annotations
+
+import json
+import logging
+
+from bosch_thermostat_client.const import BINARY, REGULAR, RESULT, TYPE, URI
+from bosch_thermostat_client.const.ivt import INVALID, STATE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def object_key(bosch_object) -> str:
+    """Return gateway path identifying Bosch object."""
+    return getattr(bosch_object, "path", None) or bosch_object.attr_id
+
+
+def object_uris(bosch_object) -> dict[str, str]:
+    """Map gateway URIs fetched by Bosch object to its data keys."""
+    data = getattr(bosch_object, "get_data", None)
+    if not isinstance(data, dict) or not hasattr(bosch_object, "process_results"):
+        return {}
+    omitted = getattr(bosch_object, "_omit_updates", None) or ()
+    return {
+        item[URI]: key
+        for key, item in data.items()
+        if isinstance(item, dict) and URI in item and key not in omitted
+    }
+
+
+def schedule_fingerprint(schedule) -> list:
+    """Return content of schedule which affects entity state.
+
+    Gateway clock is left out, it is re-read on every circuit update.
+    Only setpoint active at that time is taken, so object changes when
+    schedule passes switchpoint.
+    """
+    try:
+        current = schedule.get_temp_in_schedule()
+    except (KeyError, IndexError, TypeError, ValueError):
+        current = None
+    return [
+        schedule.active_program,
+        schedule.setpoints,
+        getattr(schedule, "_switch_points", None),
+        current,
+    ]
+
+
+def object_fingerprint(bosch_object) -> str | None:
+    """Return compact representation of values held by Bosch object.
+
+    None means values can't be compared and object is always treated as changed.
+    """
+    data = getattr(bosch_object, "get_data", None)
+    if not isinstance(data, dict):
+        return None
+    try:
+        schedule = getattr(bosch_object, "schedule", None)
+    except NotImplementedError:
+        schedule = None
+    try:
+        return json.dumps(
+            [
+                {
+                    key: item.get(RESULT) if isinstance(item, dict) else item
+                    for key, item in data.items()
+                },
+                schedule_fingerprint(schedule) if schedule else None,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def can_be_served(bosch_object) -> bool:
+    """Check if object holds only plain values which can be copied."""
+    data = getattr(bosch_object, "get_data", None)
+    return isinstance(data, dict) and all(
+        isinstance(item, dict) and item.get(TYPE) in (REGULAR, BINARY)
+        for item in data.values()
+    )
+
+
+def is_plain(bosch_object) -> bool:
+    """Check if object is a circuit or plain value object.
+
+    Those fetch all their URIs on update and keep result of last update
+    in their state flag.
+    """
+    return can_be_served(bosch_object) or not hasattr(bosch_object, "kind")
+
+
+def read_failed(bosch_object) -> bool:
+    """Check if last update of object couldn't fetch anything."""
+    return is_plain(bosch_object) and getattr(bosch_object, "_state", None) is False
+
+
+def fan_out(provider, dependent) -> None:
+    """Copy results fetched by provider object into dependent object."""
+    results = {
+        item[URI]: item.get(RESULT)
+        for item in provider.get_data.values()
+        if isinstance(item, dict) and URI in item
+    }
+    for uri, key in object_uris(dependent).items():
+        result = results.get(uri)
+        if not result:
+            continue
+        dependent.process_results(result=result, key=key)
+        dependent.get_data[key][RESULT].update(
+            {
+                res_key: value
+                for res_key, value in result.items()
+                if res_key == INVALID or res_key.startswith(f"{STATE}_")
+            }
+        )
+
+
+class PlannedRead:
+    """Single gateway read and entities depending on it."""
+
+    def __init__(self, bosch_object, priority: int = 0) -> None:
+        """Initialize planned read."""
+        self.bosch_object = bosch_object
+        self.key = object_key(bosch_object)
+        self.own_priority = priority
+        self.dependents = []
+        self.served = []
+        self.changed = True
+        self._fingerprint = None
+
+    @property
+    def all_dependents(self) -> list:
+        """Return (component_type, entity) pairs refreshed by this read."""
+        dependents = list(self.dependents)
+        for served in self.served:
+            dependents.extend(served.dependents)
+        return dependents
+
+    @property
+    def priority(self) -> int:
+        """Most urgent priority of this read and reads served by it."""
+        return min(read.own_priority for read in self.reads)
+
+    @property
+    def cost(self) -> int:
+        """Number of gateway requests issued by this read."""
+        return max(len(object_uris(self.bosch_object)), 1)
+
+    @property
+    def reads(self) -> list[PlannedRead]:
+        """Return this read and reads served by it."""
+        return [self, *self.served]
+
+    def snapshot(self) -> None:
+        """Remember values of objects before read."""
+        for read in self.reads:
+            read._fingerprint = object_fingerprint(read.bosch_object)
+
+    def compare(self) -> None:
+        """Mark objects which values changed since snapshot."""
+        for read in self.reads:
+            fingerprint = object_fingerprint(read.bosch_object)
+            read.changed = fingerprint is None or fingerprint != read._fingerprint
+
+    @property
+    def names(self) -> str:
+        """Names of entities depending on this read."""
+        return ", ".join(str(entity.name) for _, entity in self.all_dependents)
+
+
+class RefreshPlan:
+    """Distinct Bosch object reads required by one refresh cycle."""
+
+    def __init__(self) -> None:
+        """Initialize empty plan."""
+        self._reads: dict[int, PlannedRead] = {}
+
+    def __len__(self) -> int:
+        """Return number of distinct objects in plan."""
+        return len(self._reads)
+
+    def add(self, component_type, entity, priority: int = 0) -> None:
+        """Add entity to plan, sharing read with entities of same object."""
+        bosch_object = entity.bosch_object
+        planned = self._reads.get(id(bosch_object))
+        if planned is None:
+            planned = self._reads[id(bosch_object)] = PlannedRead(
+                bosch_object, priority
+            )
+        planned.own_priority = min(planned.own_priority, priority)
+        planned.dependents.append((component_type, entity))
+
+    def resolve(self) -> list[PlannedRead]:
+        """Return reads to issue.
+
+        Objects which URIs are all fetched by another planned object
+        (eg. circuit sensor and its circuit) are not read on their own,
+        they get results of that object instead.
+        """
+        providers: dict[str, PlannedRead] = {}
+        reads = []
+        for planned in sorted(
+            self._reads.values(),
+            key=lambda item: len(object_uris(item.bosch_object)),
+            reverse=True,
+        ):
+            uris = object_uris(planned.bosch_object)
+            owners = {id(providers.get(uri)) for uri in uris}
+            if (
+                uris
+                and all(uri in providers for uri in uris)
+                and len(owners) == 1
+                and can_be_served(planned.bosch_object)
+            ):
+                provider = providers[next(iter(uris))]
+                _LOGGER.debug(
+                    "Bosch object %s is served by read of %s.",
+                    planned.key,
+                    provider.key,
+                )
+                provider.served.append(planned)
+                continue
+            if is_plain(planned.bosch_object):
+                for uri in uris:
+                    providers.setdefault(uri, planned)
+            reads.append(planned)
+        return reads
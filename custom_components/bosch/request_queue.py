@@ -0,0 +1,100 @@
+"""Priority queue of requests sent to Bosch gateway."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+POLL = 1
+BACKGROUND = 2
+
+
+class PriorityRequestQueue:
+    """Share gateway slots between requests by priority.
+
+    Waiting interactive requests (services, entity writes) get free slot
+    before polling, polling before background jobs. Jobs with the same key
+    run single-flight: calls made while job is running wait for one
+    trailing run of it.
+    """
+
+    def __init__(self, slots: int) -> None:
+        """Initialize queue."""
+        self._slots = slots
+        self._busy = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._flights: set[str] = set()
+        self._trailing: dict[str, asyncio.Future] = {}
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for slot."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    async def _acquire(self, priority: int) -> None:
+        if self._busy < self._slots and not self.waiting:
+            self._busy += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over right before cancellation.
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int = POLL):
+        """Hold one gateway slot."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def coalesce(self, key: str, job: Callable[[], Awaitable]) -> None:
+        """Run job single-flight by key.
+
+        If job with same key is running, wait for one trailing run of it
+        instead of starting another one.
+        """
+        if key in self._flights:
+            trailing = self._trailing.get(key)
+            if trailing is None:
+                _LOGGER.debug("%s already in progress, queueing trailing run.", key)
+                trailing = self._trailing[key] = (
+                    asyncio.get_running_loop().create_future()
+                )
+            await asyncio.shield(trailing)
+            return
+        self._flights.add(key)
+        try:
+            await job()
+            while key in self._trailing:
+                trailing = self._trailing.pop(key)
+                try:
+                    await job()
+                finally:
+                    trailing.set_result(None)
+        finally:
+            self._flights.discard(key)
+            trailing = self._trailing.pop(key, None)
+            if trailing and not trailing.done():
+                trailing.set_result(None)
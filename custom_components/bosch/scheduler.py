@@ -0,0 +1,272 @@
+"""Polling schedule of Bosch objects."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+
+from bosch_thermostat_client.const import DAYS_INT
+
+_LOGGER = logging.getLogger(__name__)
+
+GROW_FACTOR = 1.5
+SHRINK_FACTOR = 2
+BACKOFF_BASE = 60
+BACKOFF_MAX = 1800
+QUARANTINE_THRESHOLD = 5
+PROBE_INTERVAL = 3600
+# Seconds after switchpoint when circuit is read, gateway applies it in a minute.
+SWITCHPOINT_DELAY = 60
+SCHEDULE_RELAX_FACTOR = 2
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+def gateway_time(schedule) -> datetime | None:
+    """Return gateway clock fetched with schedule on last circuit read."""
+    value = getattr(schedule, "time", None)
+    if not isinstance(value, str):
+        return None
+    date_format = getattr(schedule, "_date_format", "%Y-%m-%dT%H:%M:%S")
+    try:
+        return datetime.strptime(value[0:25], date_format)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def seconds_to_switchpoint(schedule, now: datetime) -> float | None:
+    """Return seconds from now to next switchpoint of circuit schedule.
+
+    bosch_thermostat_client doesn't expose switchpoints publicly, so they
+    are read from schedule internals. Switchpoints are in gateway time,
+    so now should be gateway clock, see gateway_time.
+    """
+    switch_points = getattr(schedule, "_switch_points", None)
+    day_key = getattr(schedule, "_day_key", None)
+    time_key = getattr(schedule, "_time_key", None)
+    if not switch_points or not day_key or not time_key:
+        return None
+    minute = (
+        now.weekday() * MINUTES_PER_DAY
+        + now.hour * 60
+        + now.minute
+        + now.second / 60
+    )
+    deltas = []
+    for point in switch_points:
+        try:
+            at = DAYS_INT.index(point[day_key]) * MINUTES_PER_DAY + int(
+                point[time_key]
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+        deltas.append((at - minute) % MINUTES_PER_WEEK or MINUTES_PER_WEEK)
+    return min(deltas) * 60 if deltas else None
+
+
+class ObjectPollState:
+    """Polling state of single Bosch object."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize poll state."""
+        self.interval = interval
+        self.next_poll = 0.0
+        self.reads = 0
+        self.changes = 0
+
+
+class AdaptivePollScheduler:
+    """Stretch polling of stable objects and tighten it for volatile ones.
+
+    Every read which brings no change makes interval of object longer,
+    up to max_interval. Every change makes it shorter, down to base_interval.
+    """
+
+    def __init__(
+        self,
+        base_interval: timedelta,
+        max_interval: timedelta,
+        tick_interval: timedelta | None = None,
+    ) -> None:
+        """Initialize scheduler.
+
+        Tick interval is period of timer which checks objects, base interval
+        if not given.
+        """
+        self._base = base_interval.total_seconds()
+        self._max = max(max_interval.total_seconds(), self._base)
+        self._tick = (tick_interval or base_interval).total_seconds()
+        self._objects: dict[str, ObjectPollState] = {}
+
+    def _get(self, key: str) -> ObjectPollState:
+        if key not in self._objects:
+            self._objects[key] = ObjectPollState(self._base)
+        return self._objects[key]
+
+    def is_due(self, key: str, now: float | None = None) -> bool:
+        """Check if object should be read in this cycle."""
+        now = time.monotonic() if now is None else now
+        # Half of tick tolerance, so ticks jitter doesn't skip a cycle.
+        return self._get(key).next_poll <= now + self._tick / 2
+
+    def record(self, key: str, changed: bool, now: float | None = None) -> None:
+        """Store result of read and plan next one."""
+        now = time.monotonic() if now is None else now
+        state = self._get(key)
+        state.reads += 1
+        if changed:
+            state.changes += 1
+            state.interval = max(self._base, state.interval / SHRINK_FACTOR)
+        else:
+            state.interval = min(self._max, state.interval * GROW_FACTOR)
+        state.next_poll = now + state.interval
+
+    def align_to_switchpoint(
+        self, key: str, seconds: float, now: float | None = None
+    ) -> None:
+        """Plan next read of scheduled object shortly after its switchpoint.
+
+        Until then object is read with relaxed interval, up to max interval.
+        """
+        now = time.monotonic() if now is None else now
+        state = self._get(key)
+        relaxed = min(self._max, state.interval * SCHEDULE_RELAX_FACTOR)
+        state.next_poll = now + min(relaxed, seconds + SWITCHPOINT_DELAY)
+
+    def expedite(self, key: str) -> None:
+        """Read object in next cycle with base interval."""
+        state = self._get(key)
+        state.interval = self._base
+        state.next_poll = 0.0
+
+    def interval(self, key: str) -> float:
+        """Return current interval of object in seconds."""
+        return self._get(key).interval
+
+
+class CycleBudget:
+    """Fit reads of one refresh cycle into time and request budget.
+
+    Reads are ordered by priority, within same priority least recently
+    read objects go first. Reads which don't fit are postponed, so they
+    are the first ones of their priority in next cycle.
+    """
+
+    def __init__(self, time_budget: timedelta | None, request_budget: int | None) -> None:
+        """Initialize cycle budget."""
+        self._time_budget = time_budget.total_seconds() if time_budget else None
+        self._request_budget = request_budget or None
+        self._last_read: dict[str, float] = {}
+
+    def select(self, reads: list) -> tuple[list, list]:
+        """Return reads which fit request budget and postponed ones."""
+        reads = sorted(
+            reads, key=lambda read: (read.priority, self._last_read.get(read.key, 0.0))
+        )
+        if not self._request_budget:
+            return reads, []
+        selected = []
+        postponed = []
+        used = 0
+        for read in reads:
+            if selected and used + read.cost > self._request_budget:
+                postponed.append(read)
+                continue
+            used += read.cost
+            selected.append(read)
+        return selected, postponed
+
+    def deadline(self, now: float | None = None) -> float | None:
+        """Return monotonic time after which no new read should start."""
+        if not self._time_budget:
+            return None
+        return (time.monotonic() if now is None else now) + self._time_budget
+
+    def mark_read(self, key: str, now: float | None = None) -> None:
+        """Remember when object was read."""
+        self._last_read[key] = time.monotonic() if now is None else now
+
+
+class PathFailure:
+    """Failure state of single gateway path."""
+
+    def __init__(self) -> None:
+        """Initialize failure state."""
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.quarantined = False
+        self.last_error = None
+
+
+class FailureTracker:
+    """Back off reads of failing paths and quarantine the dead ones.
+
+    Every consecutive failure doubles delay before next read of path.
+    After QUARANTINE_THRESHOLD failures path is only probed every
+    PROBE_INTERVAL. First successful read brings path back to normal.
+    """
+
+    def __init__(self) -> None:
+        """Initialize tracker."""
+        self._paths: dict[str, PathFailure] = {}
+
+    def is_allowed(self, key: str, now: float | None = None) -> bool:
+        """Check if path may be read now."""
+        state = self._paths.get(key)
+        if not state:
+            return True
+        return state.next_attempt <= (time.monotonic() if now is None else now)
+
+    def record_failure(
+        self, key: str, error, name: str | None = None, now: float | None = None
+    ) -> None:
+        """Store failed read and plan next attempt."""
+        now = time.monotonic() if now is None else now
+        state = self._paths.setdefault(key, PathFailure())
+        state.failures += 1
+        state.last_error = str(error)
+        if state.failures >= QUARANTINE_THRESHOLD:
+            if not state.quarantined:
+                _LOGGER.warning(
+                    "Bosch path %s (%s) failed %d times, probing it every %d seconds. %s",
+                    key,
+                    name,
+                    state.failures,
+                    PROBE_INTERVAL,
+                    error,
+                )
+            state.quarantined = True
+            state.next_attempt = now + PROBE_INTERVAL
+            return
+        delay = min(BACKOFF_BASE * 2 ** (state.failures - 1), BACKOFF_MAX)
+        log = _LOGGER.warning if state.failures == 1 else _LOGGER.debug
+        log(
+            "Bosch object of entity %s is no longer available, retrying in %d seconds. %s",
+            name,
+            delay,
+            error,
+        )
+        state.next_attempt = now + delay
+
+    def record_success(self, key: str, name: str | None = None) -> None:
+        """Bring path back to normal polling."""
+        state = self._paths.pop(key, None)
+        if state and state.quarantined:
+            _LOGGER.info("Bosch path %s (%s) is available again.", key, name)
+
+    def as_dict(self, now: float | None = None) -> dict:
+        """Return failing paths for diagnostics."""
+        now = time.monotonic() if now is None else now
+        return {
+            key: {
+                "failures": state.failures,
+                "quarantined": state.quarantined,
+                "last_error": state.last_error,
+                "next_attempt_in": max(0, round(state.next_attempt - now)),
+            }
+            for key, state in self._paths.items()
+        }
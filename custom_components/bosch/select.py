@@ -4,11 +4,13 @@ Support for water heaters connected to Bosch thermostat.
 For more details about this platform, please refer to the documentation at...
 """
 from __future__ import annotations
+from functools import partial
+
 from bosch_thermostat_client.const import GATEWAY, SELECT
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschEntity
+from .bosch_entity import BoschEntity, gateway_signal
 from .const import (
     DOMAIN,
     SIGNAL_BOSCH,
@@ -38,7 +40,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             )
         )
     async_add_entities(data[SELECT])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
 
 
@@ -71,7 +73,6 @@ class BoschSelect(BoschEntity, SelectEntity):
         self._name = name
         self._attr_uri = attr_uri
         self._state = bosch_object.state
-        self._update_init = True
         self._attr_unique_id = f"{self._domain_name}{self._name}{self._uuid}"
         self._attrs = {}
         self._attr_entity_registry_enabled_default = is_enabled
@@ -93,15 +94,13 @@ class BoschSelect(BoschEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await self._bosch_object.set_value(value=option)
+        await self.async_write_value(
+            partial(self._bosch_object.set_value, value=option),
+            {"_state": option},
+            lambda: self._bosch_object.state == option,
+        )
 
     async def async_update(self) -> None:
         """Update entity state."""
-        if self._state != self._bosch_object.state:
-            self._state = self._bosch_object.state
-            self.schedule_update_ha_state()
-
-    @property
-    def should_poll(self):
-        """Don't poll."""
-        return False
+        self._state = self._bosch_object.state
+        self.async_write_state_if_changed()
@@ -11,9 +11,19 @@ from bosch_thermostat_client.const.easycontrol import ENERGY
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from ..const import CIRCUITS, DOMAIN, GATEWAY, SERVICE_MOVE_OLD_DATA, SIGNAL_BOSCH, UUID
+from ..const import (
+    CIRCUITS,
+    CONF_CUSTOM_PATHS,
+    DOMAIN,
+    GATEWAY,
+    SERVICE_MOVE_OLD_DATA,
+    SIGNAL_BOSCH,
+    UUID,
+)
+from ..bosch_entity import gateway_signal
 from .bosch import BoschSensor
 from .circuit import CircuitSensor
+from .custom import CustomPathObject, CustomPathSensor, parse_custom_paths
 from .energy import EcusRecordingSensors, EnergySensor, EnergySensors
 from .notifications import NotificationSensor
 from .recording import RecordingSensor
@@ -129,6 +139,15 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                         is_enabled=sensor.attr_id in enabled_sensors,
                     )
                 )
+    for custom_path in parse_custom_paths(config_entry.options.get(CONF_CUSTOM_PATHS)):
+        data[SENSOR].append(
+            CustomPathSensor(
+                hass=hass,
+                uuid=uuid,
+                bosch_object=CustomPathObject(gateway=gateway, **custom_path),
+                gateway=gateway,
+            )
+        )
     async_add_entities(data[SENSOR])
     async_add_entities(data[RECORDING])
     if data[RECORDING]:
@@ -140,5 +159,5 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             {},
             "move_old_entity_data_to_new",
         )
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
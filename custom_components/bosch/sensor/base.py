@@ -19,6 +19,8 @@ entity_categories = {"diagnostic": EntityCategory.DIAGNOSTIC}
 class BoschBaseSensor(BoschEntity, SensorEntity):
     """Base class for all sensor entities."""
 
+    _persisted_attrs = ("_state", "_unit_of_measurement", "_attrs")
+
     def __init__(
         self,
         hass,
@@ -56,7 +58,6 @@ class BoschBaseSensor(BoschEntity, SensorEntity):
             self._bosch_object.entity_category, None
         )
         self._state = None
-        self._update_init = True
         self._unit_of_measurement = None
         self._uuid = uuid
         if not hasattr(self, "_attr_unique_id") or not self._attr_unique_id:
@@ -83,7 +84,7 @@ class BoschBaseSensor(BoschEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
-        return self._attrs
+        return self._mark_stale(self._attrs)
 
     async def async_update(self):
         """Update state of device."""
@@ -120,6 +121,7 @@ class BoschBaseSensor(BoschEntity, SensorEntity):
                     else self._bosch_object.state
                 )
                 self._attrs["stateExtra"] = self._bosch_object.state_message
+            self.async_write_state_if_changed()
             return
         self.attrs_write(
             data={
@@ -131,9 +133,7 @@ class BoschBaseSensor(BoschEntity, SensorEntity):
         )
 
     def attrs_write(self, data, units):
-        self._attrs = data
+        self._attrs = self.filter_attributes(data)
         if self._state != INVALID:
             self._unit_of_measurement = units
-        if self._update_init:
-            self._update_init = False
-            self.async_schedule_update_ha_state()
+        self.async_write_state_if_changed()
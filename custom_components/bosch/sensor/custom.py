@@ -0,0 +1,158 @@
+"""Bosch sensors of custom gateway paths."""
+from __future__ import annotations
+
+import logging
+
+from bosch_thermostat_client.const import REGULAR, RESULT, TYPE, UNITS, URI, VALUE
+from bosch_thermostat_client.const.ivt import INVALID
+
+from ..const import CUSTOM, UNITS_CONVERTER
+from .bosch import BoschSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_custom_paths(text: str | None) -> list[dict]:
+    """Parse custom path lines in format path;value_key;unit;interval.
+
+    Only path is required, value_key defaults to value and sensors
+    without interval are refreshed with other sensors.
+    """
+    paths = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = [field.strip() for field in line.split(";")]
+        if len(fields) > 4 or not fields[0].startswith("/"):
+            raise ValueError(f"Invalid custom path line: {line}")
+        fields += [""] * (4 - len(fields))
+        path, value_key, unit, interval = fields
+        try:
+            interval = int(interval) if interval else None
+        except ValueError as err:
+            raise ValueError(f"Invalid interval in line: {line}") from err
+        if interval is not None and interval < 1:
+            raise ValueError(f"Invalid interval in line: {line}")
+        paths.append(
+            {
+                "path": path,
+                "value_key": value_key or VALUE,
+                "unit": unit or None,
+                "interval": interval,
+            }
+        )
+    return paths
+
+
+class CustomPathObject:
+    """Gateway path not modelled by bosch_thermostat_client.
+
+    Mimics Bosch object, so it is refreshed in regular cycle.
+    """
+
+    kind = CUSTOM
+    parent_id = None
+    device_class = None
+    state_class = None
+    entity_category = None
+
+    def __init__(self, gateway, path, value_key=VALUE, unit=None, interval=None):
+        """Initialize custom path object."""
+        self._gateway = gateway
+        self.path = path
+        self.value_key = value_key
+        self.unit = unit
+        self.interval = interval
+        self._data = {path: {URI: path, TYPE: REGULAR, RESULT: {}}}
+        self._state = False
+        self._update_initialized = False
+        self._extra_message = "Waiting to fetch data"
+
+    @property
+    def id(self) -> str:
+        return self.path
+
+    @property
+    def attr_id(self) -> str:
+        return self.path
+
+    @property
+    def name(self) -> str:
+        return self.path
+
+    @property
+    def get_data(self) -> dict:
+        """Return data of path."""
+        return self._data
+
+    @property
+    def state(self) -> bool:
+        return self._state
+
+    @property
+    def state_message(self) -> str:
+        return self._extra_message
+
+    @property
+    def update_initialized(self) -> bool:
+        return self._update_initialized
+
+    def get_property(self, property_name) -> dict:
+        """Retrieve response of path."""
+        return self._data.get(property_name, {}).get(RESULT, {})
+
+    def process_results(self, result, key=None) -> bool:
+        """Store gateway response."""
+        self._data[key or self.path][RESULT] = dict(result)
+        self._update_initialized = True
+        return True
+
+    async def update(self) -> None:
+        """Read path from gateway."""
+        result = await self._gateway.raw_query(self.path)
+        if not result:
+            self._state = False
+            self._extra_message = f"Can't read {self.path}."
+            return
+        self.process_results(result)
+        self._state = True
+        self._extra_message = "OK"
+
+
+class CustomPathSensor(BoschSensor):
+    """Representation of custom gateway path as sensor."""
+
+    _domain_name = "Sensors"
+
+    def __init__(self, hass, uuid, bosch_object: CustomPathObject, gateway):
+        """Initialize the sensor."""
+        self._attr_unique_id = (
+            f"{CUSTOM}{bosch_object.path}{bosch_object.value_key}{uuid}"
+        )
+        super().__init__(
+            hass=hass,
+            uuid=uuid,
+            bosch_object=bosch_object,
+            gateway=gateway,
+            name=bosch_object.path
+            if bosch_object.value_key == VALUE
+            else f"{bosch_object.path} {bosch_object.value_key}",
+            attr_uri=bosch_object.path,
+            is_enabled=True,
+        )
+
+    async def async_update(self):
+        """Update state of sensor."""
+        data = self._bosch_object.get_property(self._attr_uri)
+        value = data.get(self._bosch_object.value_key)
+        self._state = (
+            None if value in (None, INVALID) or data.get(INVALID, False) else value
+        )
+        self.attrs_write(
+            data={
+                "path": self._bosch_object.path,
+                "stateExtra": self._bosch_object.state_message,
+            },
+            units=self._bosch_object.unit or UNITS_CONVERTER.get(data.get(UNITS)),
+        )
@@ -19,6 +19,7 @@ from homeassistant.components.recorder.models import (
 
 
 from ..const import SIGNAL_ENERGY_UPDATE_BOSCH, VALUE
+from ..request_queue import BACKGROUND
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -131,9 +132,7 @@ class EnergySensor(StatisticHelper):
                 self._state = self._normalize(value.get(self._attr_read_key))
             else:
                 self._state = value.get(self._attr_read_key)
-        if self._update_init:
-            self._update_init = False
-            self.async_schedule_update_ha_state()
+        self.async_write_state_if_changed()
 
     @property
     def statistic_id(self) -> str:
@@ -170,8 +169,11 @@ class EnergySensor(StatisticHelper):
             stop_time,
             self.statistic_id,
         )
-        return await self._bosch_object.fetch_range(
-            start_time=start_time, stop_time=stop_time
+        return await self.gateway_entry.gateway_call(
+            self._bosch_object.fetch_range,
+            start_time=start_time,
+            stop_time=stop_time,
+            priority=BACKGROUND,
         )
 
     async def _upsert_past_statistics(self, start: datetime, stop: datetime) -> None:
@@ -239,7 +241,10 @@ class EnergySensor(StatisticHelper):
         last_stat = await self.get_last_stat()
         if len(last_stat) == 0 or len(last_stat[self.statistic_id]) == 0:
             _LOGGER.debug("Last stats not exist. Trying to fetch ALL data.")
-            all_stats = list((await self._bosch_object.fetch_all()).values())
+            all_stats = await self.gateway_entry.gateway_call(
+                self._bosch_object.fetch_all, priority=BACKGROUND
+            )
+            all_stats = list(all_stats.values())
             if not all_stats:
                 _LOGGER.warn("Stats not found.")
                 return
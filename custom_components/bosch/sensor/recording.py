@@ -45,9 +45,7 @@ class RecordingSensor(StatisticHelper):
         self._attr_state_class = self._bosch_object.state_class
 
         self._attr_last_reset = last_reset
-        if self._update_init:
-            self._update_init = False
-            self.async_schedule_update_ha_state()
+        self.async_write_state_if_changed()
 
     async def async_old_gather_update(self) -> None:
         """Old async update."""
@@ -24,6 +24,7 @@ from homeassistant.components.recorder.statistics import (
     StatisticsRow,
 )
 from homeassistant.components.recorder import get_instance
+from ..request_queue import BACKGROUND
 from .base import BoschBaseSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ _LOGGER = logging.getLogger(__name__)
 class StatisticHelper(BoschBaseSensor):
     """Statistic helper class."""
 
+    # Statistics are imported from gateway history, there is no state to keep.
+    _persisted_attrs = ()
+
     def __init__(self, new_stats_api: bool = False, **kwargs):
         """Initialize statistic helper."""
         self._short_id = None
@@ -63,11 +67,6 @@ class StatisticHelper(BoschBaseSensor):
         """External API statistic ID."""
         raise NotImplementedError()
 
-    @property
-    def should_poll(self):
-        """Don't poll."""
-        return False
-
     @property
     def statistic_metadata(self) -> StatisticMetaData:
         """Statistic Metadata recorder model class."""
@@ -111,7 +110,7 @@ class StatisticHelper(BoschBaseSensor):
         if not stats:
             return
         async_add_external_statistics(self.hass, self.statistic_metadata, stats)
-        self.async_schedule_update_ha_state()
+        self.async_write_state_if_changed()
 
     def get_last_stats_before_date(
         self, last_stats: dict[str, list[StatisticsRow]], day: datetime
@@ -149,8 +148,11 @@ class StatisticHelper(BoschBaseSensor):
             stop_time,
             self.statistic_id,
         )
-        my_range = await self._bosch_object.fetch_range(
-            start_time=start_time, stop_time=stop_time
+        my_range = await self.gateway_entry.gateway_call(
+            self._bosch_object.fetch_range,
+            start_time=start_time,
+            stop_time=stop_time,
+            priority=BACKGROUND,
         )
         return my_range
 
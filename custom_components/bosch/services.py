@@ -1,6 +1,10 @@
 """Services used in HA."""
 from __future__ import annotations
+import asyncio
 import logging
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any
 import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.const import ATTR_DEVICE_ID
@@ -12,12 +16,15 @@ from bosch_thermostat_client.const import RECORDING
 from .const import (
     DOMAIN,
     SERVICE_DEBUG,
+    SERVICE_CANCEL_DEBUG,
     SERVICE_UPDATE,
     BOSCH_GATEWAY_ENTRY,
     RECORDING_SERVICE_UPDATE,
     SERVICE_PUT_STRING,
     SERVICE_PUT_FLOAT,
     SERVICE_GET,
+    SERVICE_GET_BATCH,
+    SERVICE_PUT_BATCH,
     VALUE,
 )
 
@@ -26,7 +33,32 @@ from .sensor.recording import RecordingSensor
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_INTEGRATION_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.ensure_list})
+SERVICE_UPDATE_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend(
+    {
+        vol.Optional("entities"): cv.entity_ids,
+        vol.Optional("platforms"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
 SERVICE_GET_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend({vol.Required("path"): str})
+SERVICE_CACHED_GET_SCHEMA = SERVICE_GET_SCHEMA.extend(
+    {vol.Optional("bypass_cache", default=False): cv.boolean}
+)
+SERVICE_DEBUG_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend(
+    {
+        vol.Optional("compress", default=False): cv.boolean,
+        vol.Optional("path"): cv.string,
+        vol.Optional("incremental", default=False): cv.boolean,
+    }
+)
+SERVICE_GET_BATCH_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend(
+    {
+        vol.Required("paths"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("bypass_cache", default=False): cv.boolean,
+    }
+)
+SERVICE_PUT_BATCH_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend(
+    {vol.Required("values"): {cv.string: vol.Any(str, int, float)}}
+)
 SERVICE_FETCH_RANGE_SCHEMA = SERVICE_INTEGRATION_SCHEMA.extend(
     {vol.Required("day"): cv.date, vol.Required("statistic_id"): str}
 )
@@ -63,6 +95,33 @@ def find_gateway_entry(hass: HomeAssistant, devices_id: str) -> list[ConfigEntry
     return bosch_gateway_entries
 
 
+async def async_gather_gateways(
+    gateway_entries: list, job: Callable[[Any], Awaitable[Any]]
+) -> dict[str, dict]:
+    """Run job for all gateways concurrently.
+
+    Return results and errors keyed by UUID of gateway.
+    """
+    results = await asyncio.gather(
+        *[job(gateway_entry) for gateway_entry in gateway_entries],
+        return_exceptions=True,
+    )
+    data = {}
+    errors = {}
+    for gateway_entry, result in zip(gateway_entries, results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Service call failed for gateway %s. %s", gateway_entry.uuid, result)
+            errors[gateway_entry.uuid] = str(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            data[gateway_entry.uuid] = result
+    return {
+        "data": data,
+        "errors": errors
+    }
+
+
 def async_register_debug_service(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Register services."""
 
@@ -72,20 +131,42 @@ def async_register_debug_service(hass: HomeAssistant, entry: ConfigEntry) -> Non
         _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
         if not _gateway_entries:
             return
-        data = []
+        if len(_gateway_entries) > 1:
+            # Gateways are scanned concurrently, each into its own file.
+            name, ext = os.path.splitext(filename)
+            filenames = {entry.uuid: f"{name}_{entry.uuid}{ext}" for entry in _gateway_entries}
+        else:
+            filenames = {_gateway_entries[0].uuid: filename}
+        return await async_gather_gateways(
+            _gateway_entries,
+            lambda _gateway_entry: _gateway_entry.make_rawscan(
+                filenames[_gateway_entry.uuid],
+                compress=service_call.data["compress"],
+                path=service_call.data.get("path"),
+                incremental=service_call.data["incremental"],
+            ),
+        )
+
+    async def async_handle_cancel_debug_service(service_call: ServiceCall):
+        """Cancel running bosch scan."""
+        _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
         for _gateway_entry in _gateway_entries:
-            data.append(await _gateway_entry.make_rawscan(filename))
-        return {
-            "data": data
-        }
+            if not _gateway_entry.cancel_rawscan():
+                _LOGGER.info("No rawscan in progress. UUID: %s", _gateway_entry.uuid)
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_DEBUG,
         async_handle_debug_service,
-        schema=SERVICE_INTEGRATION_SCHEMA,
+        schema=SERVICE_DEBUG_SCHEMA,
         supports_response=SupportsResponse.ONLY
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_DEBUG,
+        async_handle_cancel_debug_service,
+        schema=SERVICE_INTEGRATION_SCHEMA,
+    )
 
 
 def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -96,18 +177,25 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
         if not _gateway_entries:
             return
-        for _gateway_entry in _gateway_entries:
-            await _gateway_entry.thermostat_refresh()
+        await async_gather_gateways(
+            _gateway_entries,
+            lambda _gateway_entry: _gateway_entry.async_request_refresh(
+                entity_ids=service_call.data.get("entities"),
+                platforms=service_call.data.get("platforms"),
+            ),
+        )
 
     async def async_handle_recording_sensor_refresh(service_call: ServiceCall):
         """Request update of recording sensor manually."""
         _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
         if not _gateway_entries:
             return
-        for _gateway_entry in _gateway_entries:
-            await _gateway_entry.thermostat_refresh()
-        _LOGGER.debug("Performing sensor update on service request. UUID: %s", _gateway_entry.uuid)
-        await _gateway_entry.recording_sensors_update()
+
+        async def refresh(_gateway_entry):
+            _LOGGER.debug("Performing sensor update on service request. UUID: %s", _gateway_entry.uuid)
+            await _gateway_entry.async_request_recordings_refresh()
+
+        await async_gather_gateways(_gateway_entries, refresh)
 
     async def async_handle_recording_sensor_fetch_past(service_call: ServiceCall):
         """Request update of recording sensor manually."""
@@ -116,13 +204,16 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
         if not _gateway_entries:
             return
-        for _gateway_entry in _gateway_entries:
+
+        async def fetch_past(_gateway_entry):
             recording_entities: list[RecordingSensor] = _gateway_entry.hass.data[DOMAIN][_gateway_entry.uuid].get(RECORDING, [])
             for entity in recording_entities:
                 if entity.enabled and entity.statistic_id == statistic_id:
                     _LOGGER.debug("Fetching single day by service request. UUID: %s, statistic_id: %s, day: %s", _gateway_entry.uuid, statistic_id, day)
                     await entity.insert_statistics_range(start_time=day)
 
+        await async_gather_gateways(_gateway_entries, fetch_past)
+
     async def async_handle_get(service_call: ServiceCall) -> ServiceResponse:
         """Request update of recording sensor manually."""
         _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
@@ -133,10 +224,12 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
             _LOGGER.error("Path or value not defined.")
             data = ""
         else:
-            data = []
-            for _gateway_entry in _gateway_entries:
-                single_data = await _gateway_entry.custom_get(path=_path)
-                data.append(single_data)
+            return await async_gather_gateways(
+                _gateway_entries,
+                lambda _gateway_entry: _gateway_entry.custom_get(
+                    path=_path, bypass_cache=service_call.data["bypass_cache"]
+                ),
+            )
         return {
             "data": data
         }
@@ -151,19 +244,36 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         if not _path or not _value:
             _LOGGER.error("Path or value not defined.")
             return
-        data = []
-        for _gateway_entry in _gateway_entries:
-            return_value = await _gateway_entry.custom_put(path=_path, value=_value)
-            data.append(return_value)
-        return {
-            "data": data
-        }
-        
+        return await async_gather_gateways(
+            _gateway_entries,
+            lambda _gateway_entry: _gateway_entry.custom_put(path=_path, value=_value),
+        )
+
+    async def async_handle_get_batch(service_call: ServiceCall) -> ServiceResponse:
+        """Fetch many paths at once."""
+        _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
+        return await async_gather_gateways(
+            _gateway_entries,
+            lambda _gateway_entry: _gateway_entry.custom_get_batch(
+                service_call.data["paths"], service_call.data["bypass_cache"]
+            ),
+        )
+
+    async def async_handle_put_batch(service_call: ServiceCall) -> ServiceResponse:
+        """Send many PUT commands at once."""
+        _gateway_entries = find_gateway_entry(hass=hass, devices_id=service_call.data[ATTR_DEVICE_ID])
+        return await async_gather_gateways(
+            _gateway_entries,
+            lambda _gateway_entry: _gateway_entry.custom_put_batch(
+                service_call.data["values"]
+            ),
+        )
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_UPDATE,
         async_handle_thermostat_refresh,
-        SERVICE_INTEGRATION_SCHEMA,
+        SERVICE_UPDATE_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
@@ -175,9 +285,23 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         DOMAIN,
         SERVICE_GET,
         async_handle_get,
-        schema=SERVICE_GET_SCHEMA,
+        schema=SERVICE_CACHED_GET_SCHEMA,
         supports_response=SupportsResponse.ONLY
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_BATCH,
+        async_handle_get_batch,
+        schema=SERVICE_GET_BATCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PUT_BATCH,
+        async_handle_put_batch,
+        schema=SERVICE_PUT_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_PUT_STRING,
@@ -201,4 +325,5 @@ def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
 def async_remove_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Remove services."""
     hass.services.async_remove(DOMAIN, SERVICE_DEBUG)
+    hass.services.async_remove(DOMAIN, SERVICE_CANCEL_DEBUG)
     hass.services.async_remove(DOMAIN, SERVICE_UPDATE)
@@ -4,12 +4,13 @@ Support for water heaters connected to Bosch thermostat.
 For more details about this platform, please refer to the documentation at...
 """
 import logging
+from functools import partial
 
 from bosch_thermostat_client.const import GATEWAY
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschEntity
+from .bosch_entity import BoschEntity, gateway_signal
 from .const import (
     CIRCUITS,
     CIRCUITS_SENSOR_NAMES,
@@ -61,7 +62,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 )
     data[SWITCH] = data_switch
     async_add_entities(data[SWITCH])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     return True
 
 
@@ -98,7 +99,6 @@ class BoschBaseSwitch(BoschEntity, SwitchEntity):
         self._name = name
         self._attr_uri = attr_uri
         self._state = bosch_object.state
-        self._update_init = True
         self._attr_unique_id = self._domain_name + self._name + self._uuid
         self._attrs = {}
         self._circuit_type = circuit_type
@@ -112,26 +112,29 @@ class BoschBaseSwitch(BoschEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn on switch."""
         _LOGGER.debug("Turning on %s switch.", self._name)
-        await self._bosch_object.turn_on()
-        self._state = True
-        self.schedule_update_ha_state()
+        if await self.async_write_value(
+            self._bosch_object.turn_on,
+            {"_state": True},
+            partial(self._bosch_object_is, True),
+        ):
+            await self.async_update()
 
     async def async_update(self):
-        if self._state != self._bosch_object.state:
-            self._state = self._bosch_object.state
-            self.schedule_update_ha_state()
+        self._state = self._bosch_object.state
+        self.async_write_state_if_changed()
 
     async def async_turn_off(self, **kwargs):
         """Turn off switch."""
         _LOGGER.debug("Turning off %s switch.", self._name)
-        await self._bosch_object.turn_off()
-        self._state = False
-        self.schedule_update_ha_state()
-
-    @property
-    def should_poll(self):
-        """Don't poll."""
-        return False
+        if await self.async_write_value(
+            self._bosch_object.turn_off,
+            {"_state": False},
+            partial(self._bosch_object_is, False),
+        ):
+            await self.async_update()
+
+    def _bosch_object_is(self, state: bool) -> bool:
+        return bool(self._bosch_object.state) is state
 
 
 class BoschSwitch(BoschBaseSwitch):
@@ -5,6 +5,7 @@ For more details about this platform, please refer to the documentation at...
 """
 from __future__ import annotations
 import logging
+from functools import partial
 
 from bosch_thermostat_client.const import GATEWAY, SETPOINT
 from homeassistant.components.water_heater import (
@@ -18,7 +19,7 @@ from homeassistant.const import ATTR_TEMPERATURE
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .bosch_entity import BoschClimateWaterEntity
+from .bosch_entity import BoschClimateWaterEntity, gateway_signal
 from .const import (
     BOSCH_STATE,
     CHARGE,
@@ -45,7 +46,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities) -> bool:
         for dhw in data[GATEWAY].dhw_circuits
     ]
     async_add_entities(data[WATER_HEATER])
-    async_dispatcher_send(hass, SIGNAL_BOSCH)
+    async_dispatcher_send(hass, gateway_signal(SIGNAL_BOSCH, uuid))
     platform = entity_platform.current_platform.get()
     platform.async_register_entity_service(
         SERVICE_CHARGE_START, SERVICE_CHARGE_SCHEMA, "service_charge"
@@ -57,6 +58,10 @@ class BoschWaterHeater(BoschClimateWaterEntity, WaterHeaterEntity):
     """Representation of an EcoNet water heater."""
 
     signal = SIGNAL_DHW_UPDATE_BOSCH
+    _persisted_attrs = BoschClimateWaterEntity._persisted_attrs + (
+        "_mode",
+        "_operation_list",
+    )
 
     def __init__(self, hass, uuid, bosch_object, gateway) -> None:
         """Initialize the water heater."""
@@ -76,7 +81,9 @@ class BoschWaterHeater(BoschClimateWaterEntity, WaterHeaterEntity):
         Upstream lib doesn't check if value is proper!
         """
         _LOGGER.info("Setting %s %s with value %s", self._name, CHARGE, value)
-        await self._bosch_object.set_service_call(CHARGE, value)
+        await self.async_write_value(
+            partial(self._bosch_object.set_service_call, CHARGE, value)
+        )
 
     @property
     def state_attributes(self):
@@ -93,7 +100,7 @@ class BoschWaterHeater(BoschClimateWaterEntity, WaterHeaterEntity):
     def extra_state_attributes(self):
         """Return the optional device state attributes."""
         data = {"target_temp_step": 1}
-        return data
+        return self._mark_stale(data)
 
     @property
     def current_operation(self):
@@ -126,17 +133,22 @@ class BoschWaterHeater(BoschClimateWaterEntity, WaterHeaterEntity):
         """Set new target temperature."""
         target_temp = kwargs.get(ATTR_TEMPERATURE)
         if target_temp and target_temp != self._target_temperature:
-            await self._bosch_object.set_temperature(target_temp)
+            await self.async_write_value(
+                partial(self._bosch_object.set_temperature, target_temp),
+                {"_target_temperature": target_temp},
+                lambda: self._bosch_object.target_temperature == target_temp,
+            )
         else:
             _LOGGER.error("A target temperature must be provided")
 
     async def async_set_operation_mode(self, operation_mode):
         """Set operation mode."""
         _LOGGER.debug(f"Setting operation mode of {self._name} to {operation_mode}.")
-        status = await self.bosch_object.set_ha_mode(operation_mode)
-        if status > 0:
-            return True
-        return False
+        return await self.async_write_value(
+            partial(self._bosch_object.set_ha_mode, operation_mode),
+            {"_mode": operation_mode},
+            lambda: self._bosch_object.ha_mode == operation_mode,
+        )
 
     async def async_update(self):
         """Get the latest date."""
@@ -146,14 +158,9 @@ class BoschWaterHeater(BoschClimateWaterEntity, WaterHeaterEntity):
         self._temperature_unit = UNITS_CONVERTER.get(
             self._bosch_object.temp_units if self._bosch_object.temp_units else "C"
         )
-        if (
-            self._state != self._bosch_object.state
-            or self._operation_list == self._bosch_object.ha_modes
-            or self._current_temperature != self._bosch_object.current_temp
-        ):
-            self._state = self._bosch_object.state
-            self._target_temperature = self._bosch_object.target_temperature
-            self._current_temperature = self._bosch_object.current_temp
-            self._operation_list = self._bosch_object.ha_modes
-            self._mode = self._bosch_object.ha_mode
-            self.async_schedule_update_ha_state()
+        self._state = self._bosch_object.state
+        self._target_temperature = self._bosch_object.target_temperature
+        self._current_temperature = self._bosch_object.current_temp
+        self._operation_list = self._bosch_object.ha_modes
+        self._mode = self._bosch_object.ha_mode
+        self.async_write_state_if_changed()
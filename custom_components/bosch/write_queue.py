@@ -0,0 +1,84 @@
+"""Debounced queue of writes sent to Bosch gateway."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+SUPERSEDED = object()
+
+
+class _PendingWrite:
+    """Latest write of path waiting for debounce delay."""
+
+    def __init__(
+        self, job: Callable[[], Awaitable], deadline: float, caller: asyncio.Future
+    ) -> None:
+        self.job = job
+        self.deadline = deadline
+        self.caller = caller
+
+
+class DebouncedWriteQueue:
+    """Send only latest write of each path, one write of path at a time.
+
+    Write waits delay seconds for newer value of the same path, which
+    replaces it. Replaced callers get SUPERSEDED. Writes of path are sent
+    in order they were queued.
+    """
+
+    def __init__(self, delay: float) -> None:
+        """Initialize queue."""
+        self._delay = delay
+        self._pending: dict[str, _PendingWrite] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def write(self, key: str, job: Callable[[], Awaitable]) -> Any:
+        """Queue write of path, return its result or SUPERSEDED."""
+        loop = asyncio.get_running_loop()
+        caller = loop.create_future()
+        deadline = loop.time() + self._delay
+        pending = self._pending.get(key)
+        if pending:
+            _LOGGER.debug("Replacing queued write of %s.", key)
+            pending.caller.set_result(SUPERSEDED)
+            pending.job = job
+            pending.deadline = deadline
+            pending.caller = caller
+        else:
+            pending = self._pending[key] = _PendingWrite(job, deadline, caller)
+            task = loop.create_task(self._send(key, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await asyncio.shield(caller)
+
+    async def _send(self, key: str, pending: _PendingWrite) -> None:
+        loop = asyncio.get_running_loop()
+        while (remaining := pending.deadline - loop.time()) > 0:
+            await asyncio.sleep(remaining)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # Values queued from now on wait for this write to finish.
+            del self._pending[key]
+            try:
+                result = await pending.job()
+            except Exception as err:  # pylint: disable=broad-except
+                pending.caller.set_exception(err)
+            else:
+                pending.caller.set_result(result)
+            finally:
+                # Cancelled while sending, caller must not wait forever.
+                if not pending.caller.done():
+                    pending.caller.cancel()
+
+    def cancel(self) -> None:
+        """Drop queued writes."""
+        for task in self._tasks:
+            task.cancel()
+        for pending in self._pending.values():
+            if not pending.caller.done():
+                pending.caller.cancel()
+        self._pending.clear()